@@ -6,7 +6,6 @@ import bgc_data_processing as bgc_dp
 import cartopy.crs as ccrs
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 from cartopy import feature
 
 CONFIG_FOLDER = Path("config")
@@ -170,12 +169,9 @@ if __name__ == "__main__":
     )
 
     rmse = bgc_dp.metrics.RMSE(VARIABLES_TO_COMPARE)
-    rmse_value = rmse.evaluate_storers(obs, sims)
-
     bias = bgc_dp.metrics.Bias(VARIABLES_TO_COMPARE)
-    bias_value = bias.evaluate_storers(obs, sims)
 
-    concat_values = pd.concat([rmse_value, bias_value], axis=1)
+    concat_values = bgc_dp.metrics.batch_evaluate([rmse, bias], obs, sims)
 
     print("\n---------------- Results ----------------")
 
@@ -26,7 +26,7 @@ if TYPE_CHECKING:
         LoadingVariablesSet,
         SourceVariableSet,
     )
-    from bgc_data_processing.utils.dateranges import DateRangeGenerator
+    from bgc_data_processing.utils.dateranges import DateRange, DateRangeGenerator
     from bgc_data_processing.utils.patterns import FileNamePattern
 
 
@@ -90,14 +90,15 @@ class SelectiveABFileLoader(ABFileLoader):
             if name in self.grid_file.fieldnames:
                 # load data
                 mask_2d: np.ma.masked_array = self.grid_file.read_field(name)
-                data_2d: np.ndarray = mask_2d.filled(np.nan)
+                data_2d = self._fill_masked(mask_2d)
                 data = mask(data_2d, name=variable.label)
                 # load flag
                 if flag_name is None or flag_values is None:
-                    is_valid = self._set_index(pd.Series(True, index=mask.index))
+                    is_valid = pd.Series(True, index=mask.index)
                 else:
-                    mask_2d: np.ma.masked_array = self.grid_file.read_field(name)
-                    flag_2d: np.ndarray = mask_2d.filled(np.nan)
+                    if flag_name != name:
+                        mask_2d = self.grid_file.read_field(flag_name)
+                    flag_2d = self._fill_masked(mask_2d)
                     flag_1d = mask(flag_2d, name=flag_name)
                     flag = pd.Series(flag_1d, name=variable.label)
                     is_valid = flag.isin(flag_values)
@@ -136,7 +137,7 @@ class SelectiveABFileLoader(ABFileLoader):
             Flatten values from the field.
         """
         mask_2d: np.ma.masked_array = file.read_field(fieldname=field_name, level=level)
-        data_2d: np.ndarray = mask_2d.filled(np.nan)
+        data_2d = self._fill_masked(mask_2d)
         return mask(data_2d)
 
     def _load_one_level(
@@ -145,6 +146,7 @@ class SelectiveABFileLoader(ABFileLoader):
         level: int,
         lon: pd.Series,
         lat: pd.Series,
+        fields: set[str],
         mask: "Mask",
     ) -> pd.DataFrame:
         """Load data on a single level.
@@ -159,6 +161,8 @@ class SelectiveABFileLoader(ABFileLoader):
             Longitude values series
         lat: pd.Series
             Latitude values series
+        fields : set[str]
+            Names of the fields available on the level.
 
         Returns
         -------
@@ -177,7 +181,7 @@ class SelectiveABFileLoader(ABFileLoader):
             found = False
             for alias in variable.aliases:
                 name, flag_name, flag_values = alias
-                if name in self._get_fields_by_level(file, level):
+                if name in fields:
                     # load data
                     field_df = self._load_field(
                         file=file,
@@ -190,7 +194,8 @@ class SelectiveABFileLoader(ABFileLoader):
                     field_valid = self._load_valid(file, level, flag_name, flag_values)
                     if field_valid is not None:
                         # select valid data
-                        field_df[~field_valid] = variable.default
+                        valid = mask(field_valid.reshape(mask.mask.shape))
+                        field_df[~valid] = variable.default
                     columns.append(field_df)
                     found = True
                     break
@@ -198,7 +203,7 @@ class SelectiveABFileLoader(ABFileLoader):
                 not_in_dset.append(variable)
         # create missing columns
         for missing in not_in_dset:
-            columns.append(self._create_missing_column(missing))
+            columns.append(self._create_missing_column(missing, index=mask.index))
         return pd.concat(columns, axis=1)
 
     def load(
@@ -221,11 +226,10 @@ class SelectiveABFileLoader(ABFileLoader):
         pd.DataFrame
             DataFrame corresponding to the file.
         """
-        self._index = mask.index
         basename = ABFileLoader.convert_filepath_to_basename(filepath)
         raw_data = self._read(basename=str(basename), mask=mask)
         # transform thickness in depth
-        with_depth = self._create_depth_column(raw_data)
+        with_depth = self._create_depth_column(raw_data, level_size=len(mask.index))
         # create date columns
         with_dates = self._set_date_related_columns(with_depth, basename)
         # converts types
@@ -255,6 +259,7 @@ class SelectiveABFileLoader(ABFileLoader):
         file = ABFileArchv(basename=basename, action="r")
         lon = self._get_grid_field(self._variables.longitude_var_name, mask=mask)
         lat = self._get_grid_field(self._variables.latitude_var_name, mask=mask)
+        fields_by_level = self._get_fields_by_level(file)
         all_levels = []
         # Load levels one by one
         for level in file.fieldlevels:
@@ -263,6 +268,7 @@ class SelectiveABFileLoader(ABFileLoader):
                 level=level,
                 lon=lon,
                 lat=lat,
+                fields=fields_by_level[level],
                 mask=mask,
             )
             all_levels.append(level_slice)
@@ -410,7 +416,7 @@ class Mask:
             Masked data as a pd.Series with self._index as index.
         """
         kwargs["index"] = self._index
-        return pd.Series(data_2d[self._mask].flatten(), **kwargs)
+        return pd.Series(data_2d[self._mask].ravel(), **kwargs)
 
     def intersect(self, mask_array: np.ndarray) -> "Mask":
         """Intersect the mask with another (same-shaped) boolean array.
@@ -729,6 +735,7 @@ class SelectiveDataSource(DataSource):
         self,
         filepath: Path | str,
         constraints: "Constraints",
+        dateranges: "DateRange | None" = None,
     ) -> "Storer":
         """Create storer method definition to shadow DataSource's method.
 
@@ -738,6 +745,8 @@ class SelectiveDataSource(DataSource):
             File path.
         constraints : Constraints
             Constraints.
+        dateranges : DateRange | None, optional
+            Dateranges., by default None
 
         Returns
         -------
@@ -792,6 +801,7 @@ class SelectiveDataSource(DataSource):
         saving_directory: Path | str,
         dateranges_gen: "DateRangeGenerator",
         constraints: "Constraints",
+        prefetch: bool = True,  # noqa: ARG002 : all files are loaded at once
     ) -> None:
         """Save all the data before saving it all in the saving directory.
 
@@ -803,6 +813,8 @@ class SelectiveDataSource(DataSource):
             Generator to use to retrieve dateranges.
         constraints : Constraints
             Contraints ot apply on data.
+        prefetch : bool, optional
+            Unused, all the data is loaded before being saved., by default True.
         """
         storer = self.load_all(constraints=constraints)
         saver = StorerSaver(storer)
@@ -1,6 +1,9 @@
 """Metrics to evaluate Simulations against observations."""
 
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 import numpy as np
 import pandas as pd
@@ -78,10 +81,41 @@ class BaseMetric(ABC):
         IncomparableStorersError
             If the storers have different shapes.
         """
+        obs_df, sim_df = self.select_evaluation_data(
+            observations_storer=observations_storer,
+            simulations_storer=simulations_storer,
+        )
+        return self.evaluate(observations=obs_df, simulations=sim_df)
+
+    def select_evaluation_data(
+        self,
+        observations_storer: Storer,
+        simulations_storer: Storer,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Select the data to evaluate from both storers.
+
+        Parameters
+        ----------
+        observations_storer : Storer
+            Observations storer.
+        simulations_storer : Storer
+            Simulations storer.
+
+        Returns
+        -------
+        tuple[pd.DataFrame, pd.DataFrame]
+            Observations and simulations dataframes, without rows full of nans.
+
+        Raises
+        ------
+        IncomparableStorersError
+            If the storers have different shapes.
+        """
+        get_label = attrgetter("label")
         obs_vars = observations_storer.variables
-        obs_eval_labels = [obs_vars.get(name).label for name in self._eval_vars]
+        obs_eval_labels = list(map(get_label, map(obs_vars.get, self._eval_vars)))
         sim_vars = simulations_storer.variables
-        sim_eval_labels = [sim_vars.get(name).label for name in self._eval_vars]
+        sim_eval_labels = list(map(get_label, map(sim_vars.get, self._eval_vars)))
         obs_df = observations_storer.data.filter(obs_eval_labels, axis=1)
         sim_df = simulations_storer.data.filter(sim_eval_labels, axis=1)
 
@@ -95,7 +129,7 @@ class BaseMetric(ABC):
             raise IncomparableStorersError(error_msg)
 
         nans = obs_df.isna().all(axis=1) | sim_df.isna().all(axis=1)
-        return self.evaluate(observations=obs_df[~nans], simulations=sim_df[~nans])
+        return obs_df[~nans], sim_df[~nans]
 
 
 class RMSE(BaseMetric):
@@ -135,7 +169,8 @@ class RMSE(BaseMetric):
         pd.Series
             Evaluation result, for every column.
         """
-        diff_2 = np.power(observations - simulations, 2)
+        diff = observations - simulations
+        diff_2 = diff * diff
         return np.sqrt(np.mean(diff_2, axis=0))
 
 
@@ -177,3 +212,56 @@ class Bias(BaseMetric):
             Evaluation result, for every column.
         """
         return np.mean(simulations - observations, axis=0)
+
+
+def batch_evaluate(
+    metrics: list[BaseMetric],
+    observations_storer: Storer,
+    simulations_storer: Storer,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """Evaluate several metrics on two storers, spreading columns over threads.
+
+    Metrics are computed column by column, hence every metric's columns are \
+    split into chunks which are evaluated concurrently.
+
+    Parameters
+    ----------
+    metrics : list[BaseMetric]
+        Metrics to evaluate.
+    observations_storer : Storer
+        Observations storer.
+    simulations_storer : Storer
+        Simulations storer.
+    max_workers : int | None, optional
+        Maximum number of threads to use, if None, uses the number of CPUs.
+        , by default None
+
+    Returns
+    -------
+    pd.DataFrame
+        Evaluation results, one column per metric and one row per variable.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for metric in metrics:
+            obs_df, sim_df = metric.select_evaluation_data(
+                observations_storer=observations_storer,
+                simulations_storer=simulations_storer,
+            )
+            columns_nb = obs_df.shape[1]
+            chunks_nb = max(1, min(max_workers, columns_nb))
+            chunks = np.array_split(np.arange(columns_nb), chunks_nb)
+            futures = [
+                executor.submit(
+                    metric.evaluate,
+                    observations=obs_df.iloc[:, chunk],
+                    simulations=sim_df.iloc[:, chunk],
+                )
+                for chunk in chunks
+            ]
+            partial_results = [future.result() for future in futures]
+            results.append(pd.concat(partial_results, axis=0))
+    return pd.concat(results, axis=1)
@@ -1,11 +1,13 @@
 """Extract data from storers with given conditions."""
 
+import math
 from datetime import datetime
+from itertools import pairwise
 from typing import TYPE_CHECKING, Any
 
-import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 from shapely import Polygon
 
 from bgc_data_processing.core.storers import Storer
@@ -14,12 +16,83 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
+def _to_numpy_scalar(value: int | float | datetime) -> np.generic | Any:
+    """Convert a boundary value to the equivalent numpy scalar.
+
+    Parameters
+    ----------
+    value : int | float | datetime
+        Value to convert.
+
+    Returns
+    -------
+    np.generic | Any
+        np.datetime64 for datetimes, np.int64 for integers, np.float64 for \
+        floats, the value itself otherwise.
+    """
+    if isinstance(value, datetime):
+        return np.datetime64(value, "ns")
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return np.int64(value)
+    if isinstance(value, float):
+        return np.float64(value)
+    return value
+
+
+def _points_in_simple_polygon(
+    x: np.ndarray,
+    y: np.ndarray,
+    polygon: Polygon,
+) -> np.ndarray:
+    """Test whether points are strictly inside a polygon without holes.
+
+    Uses the crossing number algorithm, vectorized over the points.
+    Points lying on the polygon's boundary are considered outside, \
+    as with shapely's 'within'.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Points' x coordinates.
+    y : np.ndarray
+        Points' y coordinates.
+    polygon : Polygon
+        Polygon to test the points against.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array, True for the points inside the polygon.
+    """
+    vertices = np.asarray(polygon.exterior.coords)
+    is_inside = np.zeros(x.shape, dtype=bool)
+    is_on_edge = np.zeros(x.shape, dtype=bool)
+    for (x_start, y_start), (x_end, y_end) in pairwise(vertices):
+        crosses_y = (y_start > y) != (y_end > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = x_start + (y - y_start) * (x_end - x_start) / (y_end - y_start)
+        is_inside ^= crosses_y & (x < x_cross)
+        cross_product = (x_end - x_start) * (y - y_start) - (y_end - y_start) * (
+            x - x_start
+        )
+        is_on_edge |= (
+            (cross_product == 0)
+            & (x >= min(x_start, x_end))
+            & (x <= max(x_start, x_end))
+            & (y >= min(y_start, y_end))
+            & (y <= max(y_start, y_end))
+        )
+    return is_inside & ~is_on_edge
+
+
 class Constraints:
     """Slicer object to slice dataframes."""
 
     def __init__(self) -> None:
         """Initiate slicer object to slice dataframes."""
-        self.boundaries: dict[str, dict[str, int | float | datetime]] = {}
+        self.boundaries: dict[str, dict[str, int | float | datetime | bool]] = {}
         self.supersets: dict[str, list] = {}
         self.constraints: dict[str, Callable] = {}
         self.polygons: list[dict[str, str | Polygon]] = []
@@ -47,13 +120,18 @@ class Constraints:
         maximal_value : int | float | datetime, optional
             Maximum value for the column., by default np.nan
         """
-        is_min_nan = isinstance(minimal_value, float) and np.isnan(minimal_value)
-        is_max_nan = isinstance(maximal_value, float) and np.isnan(maximal_value)
+        is_min_nan = isinstance(minimal_value, float) and math.isnan(minimal_value)
+        is_max_nan = isinstance(maximal_value, float) and math.isnan(maximal_value)
         if not (is_min_nan and is_max_nan):
             self.boundaries[field_label] = {
                 "min": minimal_value,
                 "max": maximal_value,
+                "has_min": not is_min_nan,
+                "has_max": not is_max_nan,
+                "typed_min": _to_numpy_scalar(minimal_value),
+                "typed_max": _to_numpy_scalar(maximal_value),
             }
+            self.constraints.pop(field_label, None)
 
     def add_superset_constraint(
         self,
@@ -74,6 +152,7 @@ class Constraints:
             values_superset = []
         if values_superset:
             self.supersets[field_label] = values_superset
+            self.constraints.pop(field_label, None)
 
     def add_polygon_constraint(
         self,
@@ -99,7 +178,7 @@ class Constraints:
         }
         self.polygons.append(constraint_dict)
 
-    def _apply_boundary_constraints(self, df: pd.DataFrame) -> pd.Series:
+    def _apply_boundary_constraints(self, df: pd.DataFrame) -> np.ndarray:
         """Evaluate all boundary constraints to a DataFrame.
 
         Parameters
@@ -109,29 +188,19 @@ class Constraints:
 
         Returns
         -------
-        pd.Series
-            Boolean series of the rows verifying all constraints.
+        np.ndarray
+            Boolean array of the rows verifying all constraints.
         """
-        series = np.empty(df.iloc[:, 0].shape, dtype=bool)
-        series.fill(True)
+        verify_all = np.ones(df.shape[0], dtype=bool)
         for label, bounds in self.boundaries.items():
-            minimum = bounds["min"]
-            maximum = bounds["max"]
-            label_series = df[label]
-            is_min_nan = isinstance(minimum, float) and np.isnan(minimum)
-            is_max_nan = isinstance(maximum, float) and np.isnan(maximum)
-            if is_min_nan and is_max_nan:
-                continue
-            if is_max_nan:
-                bool_series = label_series >= minimum
-            elif is_min_nan:
-                bool_series = label_series <= maximum
-            else:
-                bool_series = (label_series >= minimum) & (label_series <= maximum)
-            series = series & bool_series
-        return series
-
-    def _apply_superset_constraints(self, df: pd.DataFrame) -> pd.Series:
+            values = df[label].to_numpy()
+            if bounds["has_min"]:
+                verify_all &= values >= bounds["typed_min"]
+            if bounds["has_max"]:
+                verify_all &= values <= bounds["typed_max"]
+        return verify_all
+
+    def _apply_superset_constraints(self, df: pd.DataFrame) -> np.ndarray:
         """Evaluate all superset constraints to a DataFrame.
 
         Parameters
@@ -141,19 +210,16 @@ class Constraints:
 
         Returns
         -------
-        pd.Series
-            Boolean series of the rows verifying all constraints.
+        np.ndarray
+            Boolean array of the rows verifying all constraints.
         """
-        series = np.empty(df.iloc[:, 0].shape, dtype=bool)
-        series.fill(True)
+        verify_all = np.ones(df.shape[0], dtype=bool)
         for label, value_set in self.supersets.items():
             if value_set:
-                label_series = df[label]
-                bool_series = label_series.isin(value_set)
-            series = series & bool_series
-        return series
+                verify_all &= np.isin(df[label].to_numpy(), value_set)
+        return verify_all
 
-    def _apply_polygon_constraints(self, df: pd.DataFrame) -> pd.Series:
+    def _apply_polygon_constraints(self, df: pd.DataFrame) -> np.ndarray:
         """Evaluate all polygon constraints to a DataFrame.
 
         Parameters
@@ -163,22 +229,26 @@ class Constraints:
 
         Returns
         -------
-        pd.Series
-            Boolean series of the rows verifying all constraints.
+        np.ndarray
+            Boolean array of the rows verifying all constraints.
         """
-        series = np.empty(df.iloc[:, 0].shape, dtype=bool)
-        series.fill(True)
+        verify_all = np.ones(df.shape[0], dtype=bool)
         for constraint in self.polygons:
-            longitude = constraint["longitude_field"]
-            latitude = constraint["latitude_field"]
+            longitudes = df[constraint["longitude_field"]].to_numpy(dtype=float)
+            latitudes = df[constraint["latitude_field"]].to_numpy(dtype=float)
             polygon = constraint["polygon"]
-            geometry = gpd.points_from_xy(
-                x=df[longitude],
-                y=df[latitude],
-            )
-            is_in_polygon = geometry.within(polygon)
-            series = series & is_in_polygon
-        return series
+            if isinstance(polygon, Polygon) and not polygon.interiors:
+                verify_all &= _points_in_simple_polygon(
+                    x=longitudes,
+                    y=latitudes,
+                    polygon=polygon,
+                )
+            else:
+                # Polygons with holes, multipolygons and other geometries
+                # are prepared (only once) to speed up the containment tests
+                shapely.prepare(polygon)
+                verify_all &= shapely.contains_xy(polygon, x=longitudes, y=latitudes)
+        return verify_all
 
     def apply_constraints_to_storer(self, storer: Storer) -> Storer:
         """Apply all constraints to a DataFrame.
@@ -224,7 +294,7 @@ class Constraints:
         bool_supersets = self._apply_superset_constraints(dataframe)
         bool_polygons = self._apply_polygon_constraints(dataframe)
         verify_all = bool_boundaries & bool_supersets & bool_polygons
-        return dataframe.loc[verify_all, :]
+        return dataframe.iloc[verify_all]
 
     def apply_specific_constraint(
         self,
@@ -245,19 +315,47 @@ class Constraints:
         pd.DataFrame | None
             DataFrame whose rows verify all constraints or None if inplace=True.
         """
-        constraint = Constraints()
-        if field_label in self.boundaries:
-            constraint.add_boundary_constraint(
-                field_label=field_label,
-                minimal_value=self.boundaries[field_label]["min"],
-                maximal_value=self.boundaries[field_label]["max"],
-            )
-        if field_label in self.supersets:
-            constraint.add_superset_constraint(
-                field_label=field_label,
-                value_superset=self.supersets[field_label],
-            )
-        return constraint.apply_constraints_to_dataframe(dataframe=df)
+        predicate = self._compile_predicate(field_label=field_label)
+        return df.take(np.flatnonzero(predicate(df[field_label].to_numpy())))
+
+    def _compile_predicate(
+        self,
+        field_label: str,
+    ) -> "Callable[[np.ndarray], np.ndarray]":
+        """Build (or retrieve) the predicate checking all constraints on a field.
+
+        Parameters
+        ----------
+        field_label : str
+            Label of the field to get the predicate of.
+
+        Returns
+        -------
+        Callable[[np.ndarray], np.ndarray]
+            Predicate returning a boolean array, True for values verifying \
+            all the field's constraints.
+        """
+        if field_label in self.constraints:
+            return self.constraints[field_label]
+        bounds = self.boundaries.get(field_label, {})
+        has_min = bounds.get("has_min", False)
+        has_max = bounds.get("has_max", False)
+        minimum = bounds.get("typed_min")
+        maximum = bounds.get("typed_max")
+        superset = self.supersets.get(field_label)
+
+        def predicate(values: np.ndarray) -> np.ndarray:
+            verify_all = np.ones(values.shape, dtype=bool)
+            if has_min:
+                verify_all &= values >= minimum
+            if has_max:
+                verify_all &= values <= maximum
+            if superset:
+                verify_all &= np.isin(values, superset)
+            return verify_all
+
+        self.constraints[field_label] = predicate
+        return predicate
 
     def is_constrained(self, field_name: str) -> bool:
         """Return True if 'field_name' is constrained.
@@ -1,6 +1,9 @@
 """Read generated files."""
 
-from copy import deepcopy
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
 
 import pandas as pd
@@ -10,6 +13,8 @@ from bgc_data_processing.core.variables.sets import SourceVariableSet
 from bgc_data_processing.core.variables.vars import BaseVar, ParsedVar
 from bgc_data_processing.verbose import with_verbose
 
+_MAX_READING_THREADS = 8
+
 
 def read_files(
     filepath: Path | str | list[Path] | list[str],
@@ -90,28 +95,28 @@ def read_files(
     ... )
     """
     if isinstance(filepath, list):
-        storers = []
-        for path in filepath:
-            storer = read_files(
-                filepath=path,
-                providers_column_label=providers_column_label,
-                expocode_column_label=expocode_column_label,
-                date_column_label=date_column_label,
-                year_column_label=year_column_label,
-                month_column_label=month_column_label,
-                day_column_label=day_column_label,
-                hour_column_label=hour_column_label,
-                latitude_column_label=latitude_column_label,
-                longitude_column_label=longitude_column_label,
-                depth_column_label=depth_column_label,
-                variables_reference=variables_reference,
-                category=category,
-                unit_row_index=unit_row_index,
-                delim_whitespace=delim_whitespace,
-            )
-
-            storers.append(storer)
-        return sum(storers)
+        read_file = partial(
+            read_files,
+            providers_column_label=providers_column_label,
+            expocode_column_label=expocode_column_label,
+            date_column_label=date_column_label,
+            year_column_label=year_column_label,
+            month_column_label=month_column_label,
+            day_column_label=day_column_label,
+            hour_column_label=hour_column_label,
+            latitude_column_label=latitude_column_label,
+            longitude_column_label=longitude_column_label,
+            depth_column_label=depth_column_label,
+            variables_reference=variables_reference,
+            category=category,
+            unit_row_index=unit_row_index,
+            delim_whitespace=delim_whitespace,
+        )
+        # Parsing releases the GIL, files can therefore be read concurrently
+        max_workers = max(1, min(_MAX_READING_THREADS, len(filepath)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            storers = list(executor.map(read_file, filepath))
+        return Storer.concat(storers)
     if isinstance(filepath, Path):
         path = filepath
     elif isinstance(filepath, str):
@@ -141,6 +146,81 @@ def read_files(
     return reader.get_storer()
 
 
+@lru_cache(maxsize=128)
+def _parse_variables(
+    columns: tuple[str, ...],
+    units: tuple[str, ...],
+    dtypes: tuple[str, ...],
+) -> tuple[ParsedVar, ...]:
+    """Parse the variables of a file's columns.
+
+    The result is cached so that files sharing the same columns, \
+    units and dtypes are only parsed once.
+
+    Parameters
+    ----------
+    columns : tuple[str, ...]
+        Columns of the file.
+    units : tuple[str, ...]
+        Unit of every column.
+    dtypes : tuple[str, ...]
+        Dtype of every column.
+
+    Returns
+    -------
+    tuple[ParsedVar, ...]
+        Parsed variable of every column.
+    """
+    return tuple(
+        ParsedVar(name=column.upper(), unit=unit, var_type=dtype)
+        for column, unit, dtype in zip(columns, units, dtypes, strict=True)
+    )
+
+
+def _build_variable_set(
+    columns: tuple[str, ...],
+    units: tuple[str, ...],
+    dtypes: tuple[str, ...],
+    mandatory_vars: dict[str, str],
+    reference_vars: dict[str, BaseVar],
+) -> SourceVariableSet:
+    """Build the variable set of a file's columns.
+
+    Parameters
+    ----------
+    columns : tuple[str, ...]
+        Columns of the file.
+    units : tuple[str, ...]
+        Unit of every column.
+    dtypes : tuple[str, ...]
+        Dtype of every column.
+    mandatory_vars : dict[str, str]
+        Mapping between column name and parameter for mandatory variables.
+    reference_vars : dict[str, BaseVar]
+        Mapping between label and variable to use as reference.
+
+    Returns
+    -------
+    SourceVariableSet
+        Collection of variables.
+    """
+    parsed_vars = _parse_variables(columns=columns, units=units, dtypes=dtypes)
+    variables = {}
+    for column, parsed_var in zip(columns, parsed_vars, strict=True):
+        if column in reference_vars:
+            var = reference_vars[column].clone()
+        else:
+            var = parsed_var.clone()
+        if column in mandatory_vars:
+            variables[mandatory_vars[column]] = var
+        else:
+            variables[column.lower()] = var
+    for param in mandatory_vars.values():
+        if param not in variables:
+            variables[param] = None
+    return SourceVariableSet(**variables)
+
+
 class Reader:
     """Reading routine to parse csv files.
 
@@ -207,7 +287,7 @@ class Reader:
         delim_whitespace: bool = True,
     ):
         if variables_reference is None:
-            variables_reference: dict[str, BaseVar] = {}
+            self._reference_vars: dict[str, BaseVar] = {}
         else:
             self._reference_vars = {var.label: var for var in variables_reference}
 
@@ -215,6 +295,8 @@ class Reader:
             filepath=Path(filepath),
             unit_row_index=unit_row_index,
             delim_whitespace=delim_whitespace,
+            categorical_columns=[providers_column_label, expocode_column_label],
+            date_column_label=date_column_label,
         )
         mandatory_vars = {
             providers_column_label: "provider",
@@ -230,9 +312,14 @@ class Reader:
         }
         self._category = category
         if providers_column_label is not None:
-            self._providers = raw_df[providers_column_label].unique().tolist()
+            providers_column = raw_df[providers_column_label]
+            self._providers = providers_column.cat.categories.tolist()
         else:
             self._providers = ["????"]
+        # Categories only speed up parsing, downstream grouping expects objects
+        for label in (providers_column_label, expocode_column_label):
+            if label in raw_df.columns:
+                raw_df[label] = raw_df[label].astype(object)
         self._data = self._add_date_columns(
             raw_df,
             year_column_label,
@@ -248,6 +335,8 @@ class Reader:
         filepath: Path,
         unit_row_index: int,
         delim_whitespace: bool,
+        categorical_columns: list[str | None],
+        date_column_label: str,
     ) -> tuple[pd.DataFrame, pd.DataFrame]:
         """Read the filepath and extract the unit row.
 
@@ -259,6 +348,10 @@ class Reader:
             Index of the row with the units, None if there's no unit row.
         delim_whitespace : bool
             Whether to use whitespace as delimiters.
+        categorical_columns : list[str | None]
+            Low cardinality columns to parse as categories, None values are ignored.
+        date_column_label : str
+            Date column, parsed as dates while reading if it exists in the file.
 
         Returns
         -------
@@ -270,18 +363,68 @@ class Reader:
             unit_row = None
         else:
             skiprows = [unit_row_index]
-            unit_row = pd.read_csv(
+            unit_row = self._read_unit_row(
+                filepath=filepath,
+                unit_row_index=unit_row_index,
+                delim_whitespace=delim_whitespace,
+            )
+        if unit_row is None:
+            columns = pd.read_csv(
                 filepath,
                 delim_whitespace=delim_whitespace,
-                skiprows=lambda x: x not in [*skiprows, 0],
+                nrows=0,
+                memory_map=True,
             )
+        else:
+            columns = unit_row
+        if date_column_label in columns.columns:
+            parse_dates = [date_column_label]
+        else:
+            parse_dates = False
         raw_df = pd.read_csv(
             filepath,
             delim_whitespace=delim_whitespace,
             skiprows=skiprows,
+            dtype={label: "category" for label in categorical_columns if label},
+            parse_dates=parse_dates,
+            infer_datetime_format=True,
+            memory_map=True,
+            low_memory=False,
         )
         return raw_df, unit_row
 
+    def _read_unit_row(
+        self,
+        filepath: Path,
+        unit_row_index: int,
+        delim_whitespace: bool,
+    ) -> pd.DataFrame:
+        """Read the unit row only, without parsing the rest of the file.
+
+        Parameters
+        ----------
+        filepath : Path
+            Path to the file to read.
+        unit_row_index : int
+            Index of the row with the units.
+        delim_whitespace : bool
+            Whether to use whitespace as delimiters.
+
+        Returns
+        -------
+        pd.DataFrame
+            Unit row, with the file's columns names as columns.
+        """
+        with filepath.open("r") as file:
+            first_lines = list(islice(file, unit_row_index + 1))
+        header_line, unit_line = first_lines[0], first_lines[unit_row_index]
+        if delim_whitespace:
+            columns = header_line.split()
+            units = unit_line.split()
+        else:
+            columns, units = csv.reader([header_line, unit_line])
+        return pd.DataFrame([dict(zip(columns, units, strict=False))], columns=columns)
+
     @with_verbose(trigger_threshold=1, message="Parsing file columns.")
     def _get_variables(
         self,
@@ -305,27 +448,14 @@ class Reader:
         SourceVariableSet
             Collection of variables.
         """
-        variables = {}
-        for column in raw_df.columns:
-            if unit_row is None or column not in unit_row.columns:
-                unit = "[]"
-            else:
-                unit = unit_row[column].values[0]
-
-            default_var = ParsedVar(
-                name=column.upper(),
-                unit=unit,
-                var_type=raw_df.dtypes[column].name,
-            )
-            var = deepcopy(self._reference_vars.get(column, default_var))
-            if column in mandatory_vars:
-                variables[mandatory_vars[column]] = var
-            else:
-                variables[column.lower()] = var
-        for param in mandatory_vars.values():
-            if param not in variables.keys():
-                variables[param] = None
-        return SourceVariableSet(**variables)
+        units = {} if unit_row is None else unit_row.iloc[0].to_dict()
+        return _build_variable_set(
+            columns=tuple(raw_df.columns),
+            units=tuple(units.get(column, "[]") for column in raw_df.columns),
+            dtypes=tuple(raw_df.dtypes.astype(str)),
+            mandatory_vars=mandatory_vars,
+            reference_vars=self._reference_vars,
+        )
 
     def _make_date_column(
         self,
@@ -352,7 +482,17 @@ class Reader:
         pd.Series
             Date column.
         """
-        return pd.to_datetime(raw_df[[year_col, month_col, day_col]])
+        years = raw_df[year_col].to_numpy(dtype=float)
+        months = raw_df[month_col].to_numpy(dtype=float)
+        days = raw_df[day_col].to_numpy(dtype=float)
+        # Parse each distinct date only once, invalid dates raise a ValueError
+        codes, uniques = pd.factorize(
+            years * 10000 + months * 100 + days,
+            use_na_sentinel=False,
+        )
+        parsed = pd.to_datetime(pd.Series(uniques), format="%Y%m%d").to_numpy()
+        dates = parsed[codes]
+        return pd.Series(dates, index=raw_df.index)
 
     @with_verbose(trigger_threshold=1, message="Parsing date values.")
     def _add_date_columns(
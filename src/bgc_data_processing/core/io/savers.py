@@ -2,7 +2,7 @@
 
 from copy import copy
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 
 import pandas as pd
 
@@ -61,6 +61,7 @@ class StorerSaver:
     aggr_filename_format: str = "bgc_{category}_{dates}.txt"
     _date_field: str = "date"
     _slice_field: str = "slice"
+    _buffer_size: int = 1024 * 1024
 
     def __init__(
         self,
@@ -69,7 +70,9 @@ class StorerSaver:
     ) -> None:
         self._storer = storer
         self._variables = copy(storer.variables.saving_variables)
+        self._cache_saved_variables()
         self.save_aggregated_data_only = save_aggregated_data_only
+        self._created_dirs: set[Path] = set()
 
     @property
     def saving_order(self) -> list[str]:
@@ -79,6 +82,14 @@ class StorerSaver:
     @saving_order.setter
     def saving_order(self, var_names: list[str]) -> None:
         self._variables.set_saving_order(var_names=var_names)
+        self._cache_saved_variables()
+
+    def _cache_saved_variables(self) -> None:
+        """Store the labels and units of the variables to save."""
+        variables = self._variables
+        saved_variables = [variables.get(name) for name in variables.save_names]
+        self._save_labels = [var.label for var in saved_variables]
+        self._save_units = [var.unit for var in saved_variables]
 
     def _slice_using_drng(self, dateranges: "DateRange") -> pd.DataFrame:
         """Slice the Storer using the given DateRanges.
@@ -94,11 +105,19 @@ class StorerSaver:
             DataFrame with dateranges (as string) and slices.
         """
         df_dateranges = dateranges.as_dataframe()
-        slices_indexes = df_dateranges.apply(self._storer.slice_on_dates, axis=1)
-        return pd.concat(
-            [dateranges.as_str(), slices_indexes],
-            keys=[self._date_field, self._slice_field],
-            axis=1,
+        slices = [
+            self._storer.slice_on_dates(drng)
+            for drng in df_dateranges.to_dict(orient="records")
+        ]
+        return pd.DataFrame(
+            {
+                self._date_field: dateranges.as_str(),
+                self._slice_field: pd.Series(
+                    slices,
+                    index=df_dateranges.index,
+                    dtype=object,
+                ),
+            },
         )
 
     def _make_single_filepath(self, dates_str: str, saving_directory: Path) -> Path:
@@ -150,6 +169,8 @@ class StorerSaver:
     def _create_filepath(self, dir_path: Path, filename: str) -> Path:
         """Create the filepath given the file directory and filename.
 
+        The directory is created if needed, the file is created when first written.
+
         Parameters
         ----------
         dir_path : Path
@@ -162,88 +183,94 @@ class StorerSaver:
         Path
             dir_path/filename.
         """
-        if not dir_path.is_dir():
-            dir_path.mkdir()
-        filepath = dir_path.joinpath(filename)
-        if not filepath.is_file():
-            filepath.open("w")
-        return filepath
+        if dir_path not in self._created_dirs:
+            dir_path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(dir_path)
+        return dir_path.joinpath(filename)
 
     @with_verbose(trigger_threshold=2, message="Writing file header.")
-    def _write_header(self, filepath: Path) -> None:
+    def _write_header(self, file: TextIO) -> None:
         """Write a file's header with data variables names and units.
 
         Parameters
         ----------
-        filepath : Path
-            Filepath to the file to save the data in.
+        file : TextIO
+            Empty file to save the data in, opened in append mode.
         """
-        if filepath.is_file() and filepath.open("r").readlines():
-            return
-        variables = self._variables
-        name_format = variables.name_save_format
-        labels = [variables.get(name).label for name in variables.save_names]
-        units = [variables.get(name).unit for name in variables.save_names]
-        with filepath.open("w") as file:
-            # Write variables row
-            file.write(name_format % tuple(labels) + "\n")
-            # Write unit row
-            file.write(name_format % tuple(units) + "\n")
+        name_format = self._variables.name_save_format
+        # Variables row and unit row
+        header_line = name_format % tuple(self._save_labels)
+        unit_line = name_format % tuple(self._save_units)
+        file.write(header_line + "\n" + unit_line + "\n")
 
     @with_verbose(trigger_threshold=2, message="Appending values to file.")
-    def _write_values(self, filepath: Path, data: pd.DataFrame) -> None:
+    def _write_values(self, file: TextIO, data: pd.DataFrame) -> None:
         """Write the data values within the given file.
 
         Parameters
         ----------
-        filepath : Path
-            Filepath to the file to save the data in.
+        file : TextIO
+            File to save the data in, opened in append mode.
         data : pd.DataFrame
             Data to save.
         """
         value_format = self._variables.value_save_format
-        with filepath.open("a") as file:
-            # Write
-            lines = data.apply(lambda x: value_format % tuple(x) + "\n", axis=1)
-            if len(lines) != 0:
-                file.writelines(lines)
+        # Columns as lists of python scalars, zipped back into rows to format
+        columns = [data.iloc[:, i].tolist() for i in range(data.shape[1])]
+        lines = "\n".join([value_format % row for row in zip(*columns, strict=True)])
+        if lines:
+            file.write(lines + "\n")
 
     @with_verbose(trigger_threshold=1, message="Saving data in [filepath].")
-    def _save_data(self, filepath: Path, data_slice: "Storer") -> None:
-        """Save the data of a slice within a given file.
+    def _save_data(
+        self,
+        filepath: Path,  # noqa: ARG002 : Used in the verbose message
+        file: TextIO,
+        data: pd.DataFrame,
+    ) -> None:
+        """Save data within a given file.
 
         Parameters
         ----------
         filepath : Path
             Filepath to the file to save the data in.
-        data_slice : Storer
-            Data to save.
+        file : TextIO
+            Handle on filepath, opened in append mode.
+        data : pd.DataFrame
+            Data to save, restricted to the variables to save.
         """
-        # Parameters
-        data: pd.DataFrame = data_slice.data.loc[:, self._variables.save_labels]
-        self._write_header(filepath)
         if not data.empty:
-            self._write_values(filepath, data)
+            self._write_values(file, data)
 
-    def _save_slice(self, date_slice: pd.Series, saving_directory: Path) -> None:
+    def _save_slice(
+        self,
+        date_str: str,
+        data_slice: "Slice",
+        saving_directory: Path,
+    ) -> None:
         """Save a slice.
 
         Parameters
         ----------
-        date_slice : pd.Series
+        date_str : str
+            Dates of the slice, as 'YYYYMMDD-YYYYMMDD'.
+        data_slice : Slice
             Data slice to save.
+        saving_directory : Path
+            Path to the directory to save in.
         """
-        date_str: str = date_slice[self._date_field]
-        data_slice: "Slice" = date_slice[self._slice_field]
+        filepaths = []
         if not self.save_aggregated_data_only:
-            self._save_data(
-                filepath=self._make_single_filepath(date_str, saving_directory),
-                data_slice=data_slice,
-            )
-        self._save_data(
-            filepath=self._make_aggr_filepath(date_str[:-9], saving_directory),
-            data_slice=data_slice,
-        )
+            filepaths.append(self._make_single_filepath(date_str, saving_directory))
+        filepaths.append(self._make_aggr_filepath(date_str[:-9], saving_directory))
+        # Slice the data once for all the files to write it in
+        data = data_slice.data[self._save_labels]
+        for filepath in filepaths:
+            with filepath.open("a", buffering=self._buffer_size) as file:
+                # Append mode positions the handle at the end of the existing file
+                if file.tell() == 0:
+                    self._write_header(file)
+                self._save_data(filepath=filepath, file=file, data=data)
 
     def save_from_daterange(
         self,
@@ -261,11 +288,16 @@ class StorerSaver:
         """
         dateranges = dateranges_gen()
         dates_slices = self._slice_using_drng(dateranges)
-        dates_slices.apply(
-            self._save_slice,
-            axis=1,
-            saving_directory=Path(saving_directory),
-        )
+        for date_str, data_slice in zip(
+            dates_slices[self._date_field],
+            dates_slices[self._slice_field],
+            strict=True,
+        ):
+            self._save_slice(
+                date_str=date_str,
+                data_slice=data_slice,
+                saving_directory=Path(saving_directory),
+            )
 
     def save_all_storer(self, filepath: Path | str) -> None:
         """Save all the storer to the given file.
@@ -283,7 +315,14 @@ class StorerSaver:
         if filepath.is_file():
             error_msg = f"A file already exist at {filepath} and can not be erased."
             raise FileExistsError(error_msg)
-        self._save_data(filepath=Path(filepath), data_slice=self._storer)
+        filepath = Path(filepath)
+        with filepath.open("a", buffering=self._buffer_size) as file:
+            self._write_header(file)
+            self._save_data(
+                filepath=filepath,
+                file=file,
+                data=self._storer.data[self._save_labels],
+            )
 
     @classmethod
     def save(
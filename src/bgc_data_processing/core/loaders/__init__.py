@@ -9,12 +9,41 @@ From this namespace are accessible:
 
 """
 
-from bgc_data_processing.core.loaders.abfile_loaders import ABFileLoader
-from bgc_data_processing.core.loaders.csv_loaders import CSVLoader
-from bgc_data_processing.core.loaders.netcdf_loaders import (
-    NetCDFLoader,
-    SatelliteNetCDFLoader,
-)
+from importlib import import_module
+
+# Loaders are imported on first access, to only import the backends in use
+_LOADERS_MODULES = {
+    "ABFileLoader": "abfile_loaders",
+    "CSVLoader": "csv_loaders",
+    "NetCDFLoader": "netcdf_loaders",
+    "SatelliteNetCDFLoader": "netcdf_loaders",
+}
+
+
+def __getattr__(name: str) -> type:
+    """Import loaders lazily.
+
+    Parameters
+    ----------
+    name : str
+        Name of the attribute to get.
+
+    Returns
+    -------
+    type
+        Loader class.
+
+    Raises
+    ------
+    AttributeError
+        If name is not a loader of the module.
+    """
+    if name not in _LOADERS_MODULES:
+        error_msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_msg)
+    module = import_module(f"{__name__}.{_LOADERS_MODULES[name]}")
+    return getattr(module, name)
+
 
 __all__ = [
     "ABFileLoader",
@@ -1,6 +1,8 @@
 """ABfiles Loaders."""
 
 import datetime as dt
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 
@@ -61,7 +63,18 @@ class ABFileLoader(BaseLoader):
         )
         self.grid_basename = grid_basename
         self.grid_file = ABFileGrid(basename=grid_basename, action="r")
-        self._index = None
+        # Mandatory variables, resolved once
+        self._lon_var = variables.get(variables.longitude_var_name)
+        self._lat_var = variables.get(variables.latitude_var_name)
+        self._depth_var = variables.get(variables.depth_var_name)
+        self._date_var = variables.get(variables.date_var_name)
+        self._year_var = variables.get(variables.year_var_name)
+        self._month_var = variables.get(variables.month_var_name)
+        self._day_var = variables.get(variables.day_var_name)
+        if variables.has_hour:
+            self._hour_var = variables.get(variables.hour_var_name)
+        else:
+            self._hour_var = None
 
     @staticmethod
     def convert_filepath_to_basename(filepath: Path | str) -> Path:
@@ -80,35 +93,26 @@ class ABFileLoader(BaseLoader):
         path = Path(filepath)
         return path.parent.joinpath(path.stem)
 
-    @overload
-    def _set_index(self, data: pd.DataFrame) -> pd.DataFrame:
-        ...
-
-    @overload
-    def _set_index(self, data: pd.Series) -> pd.Series:
-        ...
-
-    def _set_index(self, data: pd.DataFrame | pd.Series) -> pd.DataFrame | pd.Series:
-        """Set the DataFrame or Series index.
+    @staticmethod
+    def _fill_masked(mask_2d: np.ma.masked_array) -> np.ndarray:
+        """Fill the masked values of a field with nan.
 
-        The first call to this function will save the index as reference. Next calls
-        will set data's index to the saved values.
+        The field's data is returned without any copy if no value is masked.
 
         Parameters
         ----------
-        data : pd.DataFrame | pd.Series
-            DataFrame or Series to use as index reference or to set the index to.
+        mask_2d : np.ma.masked_array
+            Field, as read from the abfile.
 
         Returns
         -------
-        pd.DataFrame | pd.Series
-            DataFRame or Series with the proper index.
+        np.ndarray
+            Field with nan for the masked values.
         """
-        if self._index is None:
-            self._index = data.index
-        else:
-            data.index = self._index
-        return data
+        mask = np.ma.getmask(mask_2d)
+        if mask is np.ma.nomask or not mask.any():
+            return np.ma.getdata(mask_2d)
+        return mask_2d.filled(np.nan)
 
     def _read(self, basename: str) -> pd.DataFrame:
         """Read the ABfile using abfiles tools.
@@ -129,12 +133,50 @@ class ABFileLoader(BaseLoader):
         file = ABFileArchv(basename=basename, action="r")
         lon = self._get_grid_field(self._variables.longitude_var_name)
         lat = self._get_grid_field(self._variables.latitude_var_name)
-        all_levels = []
-        # Load levels one by one
-        for level in file.fieldlevels:
-            level_slice = self._load_one_level(file, level=level, lon=lon, lat=lat)
-            all_levels.append(level_slice)
-        return pd.concat(all_levels, axis=0, ignore_index=True)
+        fields_variables = self._get_fields_variables()
+        fields_by_level = self._get_fields_by_level(file)
+        n_cells = lon.shape[0]
+        # Preallocate the values of all levels, filled level by level
+        values = np.empty(
+            (len(file.fieldlevels) * n_cells, len(fields_variables) + 2),
+            dtype=np.float64,
+        )
+        for i, level in enumerate(file.fieldlevels):
+            # Each level is directly written in its rows of the values array
+            self._load_one_level(
+                file,
+                level=level,
+                lon=lon,
+                lat=lat,
+                fields=fields_by_level[level],
+                out=values[i * n_cells : (i + 1) * n_cells],
+            )
+        labels = [lon.name, lat.name] + [var.label for var in fields_variables]
+        raw_data = pd.DataFrame(values, columns=labels, copy=False)
+        # create missing columns, as a single block
+        in_dset = self._variables.in_dset
+        missing_columns = pd.DataFrame(
+            {var.label: var.default for var in self._variables if var not in in_dset},
+            index=raw_data.index,
+        )
+        return pd.concat([raw_data, missing_columns], axis=1, copy=False)
+
+    def _get_fields_variables(self) -> list[ExistingVar]:
+        """Return the variables to load from the archive files' fields.
+
+        Longitude and latitude are excluded since they are loaded from the grid file.
+
+        Returns
+        -------
+        list[ExistingVar]
+            Variables to load from the fields.
+        """
+        grid_variables = (
+            self._variables.longitude_var_name,
+            self._variables.latitude_var_name,
+        )
+        in_dset = self._variables.in_dset
+        return [var for var in in_dset if var.name not in grid_variables]
 
     def _get_grid_field(self, variable_name: str) -> pd.Series:
         """Retrieve a field from the grid adfiles.
@@ -161,16 +203,15 @@ class ABFileLoader(BaseLoader):
             if name in self.grid_file.fieldnames:
                 # load data
                 mask_2d: np.ma.masked_array = self.grid_file.read_field(name)
-                data_2d: np.ndarray = mask_2d.filled(np.nan)
-                data_1d = data_2d.flatten()
-                data = self._set_index(pd.Series(data_1d, name=variable.label))
+                data_1d = self._fill_masked(mask_2d).ravel()
+                data = pd.Series(data_1d, name=variable.label)
                 # load flag
                 if flag_name is None or flag_values is None:
-                    is_valid = self._set_index(pd.Series(True, index=data.index))
+                    is_valid = pd.Series(True, index=data.index)
                 else:
-                    mask_2d: np.ma.masked_array = self.grid_file.read_field(name)
-                    flag_2d: np.ndarray = mask_2d.filled(np.nan)
-                    flag_1d = flag_2d.flatten()
+                    if flag_name != name:
+                        mask_2d = self.grid_file.read_field(flag_name)
+                    flag_1d = self._fill_masked(mask_2d).ravel()
                     flag = pd.Series(flag_1d, name=variable.label)
                     is_valid = flag.isin(flag_values)
                 # check flag
@@ -197,20 +238,25 @@ class ABFileLoader(BaseLoader):
         pd.DataFrame
             Type converted Dataframe.
         """
-        # Modify type :
+        to_drop = np.zeros(wrong_types.shape[0], dtype=bool)
         for var in self._variables:
-            if var.type is not str:
+            column = wrong_types[var.label]
+            # numeric and datetime values can't contain letters
+            if var.type is not str and column.dtype.kind not in "fiuM":
                 # if there are letters in the values
-                alpha_values = wrong_types[var.label].astype(str).str.isalpha()
+                alpha_values = column.astype(str).str.isalpha().to_numpy()
                 # if the value is nan (keep the "nan" values flagged at previous line)
-                nan_values = wrong_types[var.label].isnull()
-                # removing these rows
-                wrong_types = wrong_types.loc[~(alpha_values & (~nan_values)), :]
-                wrong_types[var.label] = wrong_types[var.label].astype(var.type)
-            else:
-                stripped_str_col = wrong_types[var.label].astype(var.type).str.strip()
-                wrong_types[var.label] = stripped_str_col
-        return wrong_types
+                nan_values = column.isnull().to_numpy()
+                to_drop |= alpha_values & (~nan_values)
+        # removing these rows
+        if to_drop.any():
+            wrong_types = wrong_types.take(np.flatnonzero(~to_drop))
+        # Modify type :
+        # strings are converted while being stripped
+        typed = wrong_types.astype(self._prepared_dtypes, copy=False)
+        for label in self._str_labels:
+            typed[label] = self._to_stripped_strings(typed[label])
+        return typed
 
     def load(
         self,
@@ -236,7 +282,8 @@ class ABFileLoader(BaseLoader):
         basename = self.convert_filepath_to_basename(filepath)
         raw_data = self._read(basename=str(basename))
         # transform thickness in depth
-        with_depth = self._create_depth_column(raw_data)
+        level_size = self.grid_file.jdm * self.grid_file.idm
+        with_depth = self._create_depth_column(raw_data, level_size=level_size)
         # create date columns
         with_dates = self._set_date_related_columns(with_depth, Path(basename))
         # converts types
@@ -253,7 +300,9 @@ class ABFileLoader(BaseLoader):
         level: int,
         lon: pd.Series,
         lat: pd.Series,
-    ) -> pd.DataFrame:
+        fields: set[str],
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
         """Load data on a single level.
 
         Parameters
@@ -266,42 +315,45 @@ class ABFileLoader(BaseLoader):
             Longitude values series
         lat: pd.Series
             Latitude values series
+        fields : set[str]
+            Names of the fields available on the level.
+        out : np.ndarray | None, optional
+            Array to fill with the level's data, allocated if None., by default None
 
         Returns
         -------
-        pd.DataFrame
-            Raw data from the level, for all variables of interest.
+        np.ndarray
+            Raw data from the level, with longitude, latitude and then the fields'
+            variables as columns.
         """
+        fields_variables = self._get_fields_variables()
+        if out is None:
+            shape = (lon.shape[0], len(fields_variables) + 2)
+            out = np.empty(shape, dtype=np.float64)
         # already existing columns, from grid abfiles
-        columns = [lon, lat]
-        in_dset = self._variables.in_dset
-        not_in_dset = [var for var in self._variables if var not in in_dset]
-        for variable in in_dset:
-            if variable.name == self._variables.longitude_var_name:
-                continue
-            if variable.name == self._variables.latitude_var_name:
-                continue
-            found = False
+        out[:, 0] = lon.to_numpy()
+        out[:, 1] = lat.to_numpy()
+        for j, variable in enumerate(fields_variables, start=2):
+            column = out[:, j]
             for alias in variable.aliases:
                 name, flag_name, flag_values = alias
-                if name in self._get_fields_by_level(file, level):
+                if name in fields:
                     # load data
-                    field_df = self._load_field(file=file, field_name=name, level=level)
-                    field_df = field_df.rename(variable.label)
-                    # load valid indicator
-                    field_valid = self._load_valid(file, level, flag_name, flag_values)
-                    if field_valid is not None:
-                        # select valid data
-                        field_df[~field_valid] = variable.default
-                    columns.append(field_df)
-                    found = True
+                    column[:] = self._load_field_array(file, name, level=level)
+                    # select valid data
+                    self._replace_invalid(
+                        column,
+                        file=file,
+                        level=level,
+                        flag_name=flag_name,
+                        flag_values=flag_values,
+                        default=variable.default,
+                    )
                     break
-            if not found:
-                not_in_dset.append(variable)
-        # create missing columns
-        for missing in not_in_dset:
-            columns.append(self._create_missing_column(missing))
-        return pd.concat(columns, axis=1)
+            else:
+                # create missing column
+                column.fill(variable.default)
+        return out
 
     @overload
     def _load_valid(
@@ -340,7 +392,7 @@ class ABFileLoader(BaseLoader):
         level: int,
         flag_name: str,
         flag_values: list[Any],
-    ) -> pd.Series:
+    ) -> np.ndarray:
         ...
 
     def _load_valid(
@@ -349,8 +401,8 @@ class ABFileLoader(BaseLoader):
         level: int,
         flag_name: str | None,
         flag_values: list[Any] | None,
-    ) -> pd.Series | None:
-        """Create series to keep valid data according to flag values.
+    ) -> np.ndarray | None:
+        """Create array to keep valid data according to flag values.
 
         Parameters
         ----------
@@ -365,13 +417,50 @@ class ABFileLoader(BaseLoader):
 
         Returns
         -------
-        pd.Series
+        np.ndarray
             True where the data has a valid flag.
         """
         if flag_name is None or flag_values is None:
             return None
-        filter_values = self._load_field(file, flag_name, level)
-        return filter_values.isin(flag_values)
+        filter_values = self._load_field_array(file, flag_name, level=level)
+        if len(flag_values) == 1:
+            return filter_values == flag_values[0]
+        return np.isin(filter_values, flag_values)
+
+    def _replace_invalid(
+        self,
+        values: np.ndarray,
+        file: ABFileArchv,
+        level: int,
+        flag_name: str | None,
+        flag_values: list[Any] | None,
+        default: Any,
+    ) -> None:
+        """Replace in place the values whose flag is not valid by a default value.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Values to check, modified in place.
+        file : ABFileArchv
+            File to load data from.
+        level : int
+            Number of the level to load data from.
+        flag_name : str | None
+            Name of the flag field.
+        flag_values : list[Any] | None
+            Accepted values for the flag.
+        default : Any
+            Value to replace the invalid values with.
+        """
+        if flag_name is None or flag_values is None:
+            return
+        flags = self._load_field_array(file, flag_name, level=level)
+        if len(flag_values) == 1:
+            is_invalid = flags != flag_values[0]
+        else:
+            is_invalid = np.isin(flags, flag_values, invert=True)
+        np.putmask(values, is_invalid, default)
 
     def _load_field(self, file: ABFileArchv, field_name: str, level: int) -> pd.Series:
         """Load a field from an abfile.
@@ -390,39 +479,61 @@ class ABFileLoader(BaseLoader):
         pd.Series
             Flatten values from the field.
         """
-        mask_2d: np.ma.masked_array = file.read_field(fieldname=field_name, level=level)
-        data_2d: np.ndarray = mask_2d.filled(np.nan)
-        data_1d = data_2d.flatten()
-        return self._set_index(pd.Series(data_1d))
+        data_1d = self._load_field_array(file, field_name=field_name, level=level)
+        return pd.Series(data_1d)
 
-    def _get_fields_by_level(self, file: ABFileArchv, level: int) -> dict:
-        """Match level values to the list of field names for the level.
+    def _load_field_array(
+        self,
+        file: ABFileArchv,
+        field_name: str,
+        level: int,
+    ) -> np.ndarray:
+        """Load a field from an abfile as a flat array.
 
         Parameters
         ----------
         file : ABFileArchv
             File to load dat from.
+        field_name : str
+            Name of the field to load.
         level : int
             Number of the level to load data from.
 
         Returns
         -------
-        dict
+        np.ndarray
+            Flatten values from the field.
+        """
+        mask_2d: np.ma.masked_array = file.read_field(
+            fieldname=field_name,
+            level=level,
+        )
+        return self._fill_masked(mask_2d).ravel()
+
+    def _get_fields_by_level(self, file: ABFileArchv) -> dict[int, set[str]]:
+        """Match level values to the set of field names for the level.
+
+        Parameters
+        ----------
+        file : ABFileArchv
+            File to load dat from.
+
+        Returns
+        -------
+        dict[int, set[str]]
             Mapping between level value and field names.
         """
-        fields_levels = {}
+        fields_levels: dict[int, set[str]] = {}
         level_bfile = self.level_key_bfile
         field_bfile = self.field_key_bfile
         for field in file.fields.values():
-            if field[level_bfile] not in fields_levels:
-                fields_levels[field[level_bfile]] = [field[field_bfile]]
-            else:
-                fields_levels[field[level_bfile]].append(field[field_bfile])
-        return fields_levels[level]
+            fields_levels.setdefault(field[level_bfile], set()).add(field[field_bfile])
+        return fields_levels
 
     def _create_depth_column(
         self,
         thickness_df: pd.DataFrame,
+        level_size: int | None = None,
     ) -> pd.Series:
         """Create the depth column based on thickness values.
 
@@ -430,26 +541,118 @@ class ABFileLoader(BaseLoader):
         ----------
         thickness_df : pd.DataFrame
             DataFrame with thickness values (in Pa).
+        level_size : int | None, optional
+            Number of rows of every level, if the rows are ordered level by level
+            with the same cells order on every level., by default None
 
         Returns
         -------
         pd.Series
             Dataframe with depth values (in m).
         """
-        longitude_var = self._variables.get(self._variables.longitude_var_name)
-        latitude_var = self._variables.get(self._variables.latitude_var_name)
-        depth_var = self._variables.get(self._variables.depth_var_name)
-        group = thickness_df[[longitude_var.label, latitude_var.label, depth_var.label]]
-        pres_pascal = group.groupby(
-            [longitude_var.label, latitude_var.label],
-            dropna=False,
-        ).cumsum()
-        pres_sum = pres_pascal[depth_var.label]
-        half_thickness = thickness_df[depth_var.label] / 2
-        depth_meters = (pres_sum - half_thickness) / self.pascal_by_seawater_meter
+        depth_var = self._depth_var
+        thickness = thickness_df[depth_var.label].to_numpy()
+        if level_size and thickness.shape[0] % level_size == 0:
+            # Sum the thickness along each cell's column, levels being stacked
+            thickness_2d = thickness.reshape(-1, level_size)
+            pres_pascal = np.nancumsum(thickness_2d, axis=0).ravel()
+        else:
+            pres_pascal = self._cumsum_by_coordinates(
+                lon=thickness_df[self._lon_var.label].to_numpy(),
+                lat=thickness_df[self._lat_var.label].to_numpy(),
+                values=thickness,
+            )
+        half_thickness = thickness / 2
+        depth_meters = (pres_pascal - half_thickness) / self.pascal_by_seawater_meter
         thickness_df[depth_var.label] = -np.abs(depth_meters)
         return thickness_df
 
+    @staticmethod
+    def _cumsum_by_coordinates(
+        lon: np.ndarray,
+        lat: np.ndarray,
+        values: np.ndarray,
+    ) -> np.ndarray:
+        """Cumulative sum of values over the rows sharing the same coordinates.
+
+        Rows are stably sorted by coordinates, summed all at once and the sum of
+        the previous groups is then subtracted from each group. Nan values are
+        skipped and nan coordinates are considered equal.
+
+        Parameters
+        ----------
+        lon : np.ndarray
+            Longitude of the rows.
+        lat : np.ndarray
+            Latitude of the rows.
+        values : np.ndarray
+            Values to sum.
+
+        Returns
+        -------
+        np.ndarray
+            Cumulative sums, in the rows' original order.
+        """
+        order = np.lexsort((lat, lon))
+        sorted_lon, sorted_lat = lon[order], lat[order]
+        sorted_values = np.nan_to_num(values[order], nan=0)
+        # Rows starting a new group of coordinates
+        same_lon = (sorted_lon[1:] == sorted_lon[:-1]) | (
+            np.isnan(sorted_lon[1:]) & np.isnan(sorted_lon[:-1])
+        )
+        same_lat = (sorted_lat[1:] == sorted_lat[:-1]) | (
+            np.isnan(sorted_lat[1:]) & np.isnan(sorted_lat[:-1])
+        )
+        is_start = np.concatenate([[True], ~(same_lon & same_lat)])
+        cumsum = np.cumsum(sorted_values)
+        # Sum of all the groups before each group
+        before_start = (cumsum - sorted_values)[is_start]
+        sorted_sums = cumsum - before_start[np.cumsum(is_start) - 1]
+        sums = np.empty_like(sorted_sums)
+        sums[order] = sorted_sums
+        return sums
+
+    @staticmethod
+    @lru_cache
+    def prescan_directory(dirpath: Path) -> frozenset[str]:
+        """List the names of the files in a directory.
+
+        The listing is cached, directories are therefore only scanned once.
+
+        Parameters
+        ----------
+        dirpath : Path
+            Directory to scan.
+
+        Returns
+        -------
+        frozenset[str]
+            Names of the files in the directory.
+        """
+        try:
+            with os.scandir(dirpath) as entries:
+                return frozenset(entry.name for entry in entries if entry.is_file())
+        except FileNotFoundError:
+            return frozenset()
+
+    def _file_exists(self, filepath: Path) -> bool:
+        """Check whether a file exists, using the scan of its directory.
+
+        Parameters
+        ----------
+        filepath : Path
+            File filepath.
+
+        Returns
+        -------
+        bool
+            True if the file exists.
+        """
+        if filepath.name in self.prescan_directory(filepath.parent):
+            return True
+        # The file may have been created after the directory was scanned
+        return filepath.is_file()
+
     def is_file_valid(self, filepath: Path | str) -> bool:
         """Check whether a file is valid or not.
 
@@ -472,25 +675,20 @@ class ABFileLoader(BaseLoader):
         """
         path = Path(filepath)
         basepath = path.parent / path.name[:-2]
-        keep_filepath = str(path) not in self.excluded_filenames
-        keep_filename = path.name not in self.excluded_filenames
-        keep_file = keep_filename and keep_filepath
-        keep_basepath = str(basepath) not in self.excluded_filenames
-        keep_basename = basepath.name not in self.excluded_filenames
-        keep_base = keep_basename and keep_basepath
         afile_path = Path(f"{basepath}.a")
         bfile_path = Path(f"{basepath}.b")
-        if not afile_path.is_file():
+        if not self._file_exists(afile_path):
             error_msg = f"{afile_path} does not exist."
             raise FileNotFoundError(error_msg)
-        if not bfile_path.is_file():
+        if not self._file_exists(bfile_path):
             error_msg = f"{bfile_path} does not exist."
             raise FileNotFoundError(error_msg)
-        return keep_base and keep_file
+        return self._keep(str(path), path.name, str(basepath), basepath.name)
 
     def _create_missing_column(
         self,
         missing_column_variable: ExistingVar | NotExistingVar,
+        index: pd.Index,
     ) -> pd.Series:
         """Create column for missing variables using default value.
 
@@ -498,6 +696,8 @@ class ABFileLoader(BaseLoader):
         ----------
         missing_column_variable : ExistingVar | NotExistingVar
             Variable corresponding to the missing column.
+        index : pd.Index
+            Index of the column.
 
         Returns
         -------
@@ -506,7 +706,7 @@ class ABFileLoader(BaseLoader):
         """
         default_value = missing_column_variable.default
         name = missing_column_variable.label
-        return pd.Series(default_value, name=name, index=self._index)
+        return pd.Series(default_value, name=name, index=index)
 
     def _set_date_related_columns(
         self,
@@ -533,18 +733,21 @@ class ABFileLoader(BaseLoader):
 
         date = dt.datetime.strptime(date_part_basename, "%Y_%j_%H")
 
-        date_var = self._variables.get(self._variables.date_var_name)
-        year_var = self._variables.get(self._variables.year_var_name)
-        month_var = self._variables.get(self._variables.month_var_name)
-        day_var = self._variables.get(self._variables.day_var_name)
-
-        without_dates[date_var.label] = date.date()
-        without_dates[year_var.label] = date.year
-        without_dates[month_var.label] = date.month
-        without_dates[day_var.label] = date.day
-
-        hour_var = self._variables.get(self._variables.hour_var_name)
-        if hour_var is not None:
-            without_dates[hour_var.label] = date.hour
-
+        n_rows = without_dates.shape[0]
+        # Typed arrays: columns are directly created with their final dtype
+        dates_block = {
+            self._date_var.label: np.full(n_rows, np.datetime64(date.date(), "ns")),
+            self._year_var.label: np.full(n_rows, date.year, dtype=np.int64),
+            self._month_var.label: np.full(n_rows, date.month, dtype=np.int64),
+            self._day_var.label: np.full(n_rows, date.day, dtype=np.int64),
+        }
+        if self._hour_var is not None:
+            dates_block[self._hour_var.label] = np.full(
+                n_rows,
+                date.hour,
+                dtype=np.int64,
+            )
+        # The placeholder columns of the missing variables are replaced
+        for label, column in dates_block.items():
+            without_dates[label] = column
         return without_dates
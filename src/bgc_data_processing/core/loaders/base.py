@@ -2,12 +2,17 @@
 
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from bgc_data_processing.core.filtering import Constraints
     from bgc_data_processing.core.variables.sets import LoadingVariablesSet
 
 
@@ -27,6 +32,8 @@ class BaseLoader(ABC):
         both the one in the data file but and the one not represented in the file.
     """
 
+    _max_loading_threads: int = 1
+
     def __init__(
         self,
         provider_name: str,
@@ -37,7 +44,9 @@ class BaseLoader(ABC):
         self._provider = provider_name
         self._category = category
         self._exclude = exclude
+        self._exclude_set = frozenset(exclude)
         self._variables = variables
+        self._scalar_corrections: set["Callable"] = set()
 
     @property
     def provider(self) -> str:
@@ -72,11 +81,72 @@ class BaseLoader(ABC):
         """
         return self._variables
 
+    @property
+    def max_loading_threads(self) -> int:
+        """Maximum number of files which can be loaded concurrently.
+
+        Returns
+        -------
+        int
+            Maximum number of loading threads.
+        """
+        return self._max_loading_threads
+
     @property
     def excluded_filenames(self) -> list[str]:
         """Filenames to exclude from loading."""
         return self._exclude
 
+    @cached_property
+    def _labels(self) -> dict[str, str | None]:
+        """Labels of the mandatory variables, resolved once.
+
+        Returns
+        -------
+        dict[str, str | None]
+            Mapping between the variables' roles ('date', 'year', 'latitude'...) and
+            their labels, None for optional variables which are not defined.
+        """
+        variables = self._variables
+        names = {
+            "expocode": variables.expocode_var_name,
+            "provider": variables.provider_var_name,
+            "date": variables.date_var_name,
+            "year": variables.year_var_name,
+            "month": variables.month_var_name,
+            "day": variables.day_var_name,
+            "hour": variables.hour_var_name,
+            "latitude": variables.latitude_var_name,
+            "longitude": variables.longitude_var_name,
+            "depth": variables.depth_var_name,
+        }
+        return {
+            role: None if name is None else variables.get(name).label
+            for role, name in names.items()
+        }
+
+    @cached_property
+    def _prepared_dtypes(self) -> dict[str, type]:
+        """Types to convert the non-string variables to, resolved once.
+
+        Returns
+        -------
+        dict[str, type]
+            Mapping between the variables' labels and their types.
+        """
+        return {var.label: var.type for var in self._variables if var.type is not str}
+
+    @cached_property
+    def _str_labels(self) -> list[str]:
+        """Labels of the string variables, resolved once.
+
+        Returns
+        -------
+        list[str]
+            Labels of the variables whose type is str.
+        """
+        return [var.label for var in self._variables if var.type is str]
+
     def is_file_valid(self, filepath: Path | str) -> bool:
         """Indicate whether a file is valid to be kept or not.
 
@@ -90,10 +160,22 @@ class BaseLoader(ABC):
         bool
             True if the name is not to be excluded.
         """
-        keep_path = str(filepath) not in self.excluded_filenames
-        keep_name = Path(filepath).name not in self.excluded_filenames
+        return self._keep(str(filepath), Path(filepath).name)
+
+    def _keep(self, *names: str) -> bool:
+        """Indicate whether none of the given names is to be excluded.
 
-        return keep_name and keep_path
+        Parameters
+        ----------
+        *names : str
+            Filepaths or filenames to check.
+
+        Returns
+        -------
+        bool
+            True if no name is to be excluded.
+        """
+        return self._exclude_set.isdisjoint(names)
 
     @abstractmethod
     def load(self, filepath: str) -> pd.DataFrame:
@@ -106,6 +188,33 @@ class BaseLoader(ABC):
         """
         ...
 
+    def _apply_date_constraint(
+        self,
+        df: pd.DataFrame,
+        constraints: "Constraints",
+    ) -> pd.DataFrame:
+        """Only keep the rows verifying the date constraint.
+
+        Applying it as soon as the dates are known avoids processing rows \
+        which would be dropped by the constraints anyway.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame with a date column.
+        constraints : Constraints
+            Constraints to get the date constraint from.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with the rows verifying the date constraint.
+        """
+        date_label = self._labels["date"]
+        if not constraints.is_constrained(date_label):
+            return df
+        return constraints.apply_specific_constraint(field_label=date_label, df=df)
+
     def remove_nan_rows(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove rows.
 
@@ -122,18 +231,37 @@ class BaseLoader(ABC):
         # Load keys
         vars_to_remove_when_any_nan = self._variables.to_remove_if_any_nan
         vars_to_remove_when_all_nan = self._variables.to_remove_if_all_nan
+        if not vars_to_remove_when_any_nan and not vars_to_remove_when_all_nan:
+            return df
         # Check for nans
+        to_drop = np.zeros(df.shape[0], dtype=bool)
         if vars_to_remove_when_any_nan:
-            any_nans = df[vars_to_remove_when_any_nan].isna().any(axis=1)
-        else:
-            any_nans = pd.Series(False, index=df.index)
+            to_drop |= df[vars_to_remove_when_any_nan].isna().to_numpy().any(axis=1)
         if vars_to_remove_when_all_nan:
-            all_nans = df[vars_to_remove_when_all_nan].isna().all(axis=1)
-        else:
-            all_nans = pd.Series(False, index=df.index)
-        # Get indexes to drop
-        indexes_to_drop = df[any_nans | all_nans].index
-        return df.drop(index=indexes_to_drop)
+            to_drop |= df[vars_to_remove_when_all_nan].isna().to_numpy().all(axis=1)
+        return df.take(np.flatnonzero(~to_drop))
+
+    @staticmethod
+    def _to_stripped_strings(column: pd.Series) -> pd.Series:
+        """Convert the values of a column to stripped strings.
+
+        Each distinct value is only converted and stripped once, which is much
+        faster on columns with a few distinct values, such as the provider or the
+        expocode.
+
+        Parameters
+        ----------
+        column : pd.Series
+            Column to convert.
+
+        Returns
+        -------
+        pd.Series
+            Column of stripped strings.
+        """
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        stripped = uniques.astype(str).str.strip().take(codes)
+        return pd.Series(stripped, index=column.index, name=column.name)
 
     def _correct(self, to_correct: pd.DataFrame) -> pd.DataFrame:
         """Apply corrections functions defined in Var object to dataframe.
@@ -150,6 +278,41 @@ class BaseLoader(ABC):
         """
         # Modify type :
         for label, correction_func in self._variables.corrections.items():
-            correct = to_correct.pop(label).apply(correction_func)
+            correct = self._apply_correction(to_correct.pop(label), correction_func)
             to_correct.insert(len(to_correct.columns), label, correct)
         return to_correct
+
+    def _apply_correction(
+        self,
+        column: pd.Series,
+        correction_func: "Callable",
+    ) -> pd.Series:
+        """Apply a correction function to a column.
+
+        The function is called once on all the column's values and is only applied
+        value by value if it does not support arrays.
+
+        Parameters
+        ----------
+        column : pd.Series
+            Column to correct.
+        correction_func : Callable
+            Correction function.
+
+        Returns
+        -------
+        pd.Series
+            Corrected column.
+        """
+        is_numeric = column.dtype.kind in "biuf"
+        if is_numeric and correction_func not in self._scalar_corrections:
+            values = column.to_numpy()
+            try:
+                corrected = correction_func(values)
+            except (TypeError, ValueError):
+                corrected = None
+            if isinstance(corrected, np.ndarray) and corrected.shape == values.shape:
+                return pd.Series(corrected, index=column.index, name=column.name)
+            # Remember the function to directly apply it value by value next time
+            self._scalar_corrections.add(correction_func)
+        return column.apply(correction_func)
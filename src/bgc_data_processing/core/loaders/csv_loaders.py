@@ -1,5 +1,6 @@
 """CSV Loaders."""
 
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,6 +12,8 @@ from bgc_data_processing.core.filtering import Constraints
 from bgc_data_processing.core.loaders.base import BaseLoader
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from bgc_data_processing.core.variables.sets import SourceVariableSet
     from bgc_data_processing.core.variables.vars import ExistingVar
 
@@ -31,8 +34,14 @@ class CSVLoader(BaseLoader):
         both the one in the data file but and the one not represented in the file.
     read_params : dict | None, optional
         Additional parameter to pass to pandas.read_csv., by default None
+    chunk_rows : int | None, optional
+        Number of rows to read and process at once, the whole file is read \
+        at once if None., by default 500_000
     """
 
+    # pandas' parser releases the GIL, files can therefore be loaded concurrently
+    _max_loading_threads: int = 4
+
     def __init__(
         self,
         provider_name: str,
@@ -40,11 +49,13 @@ class CSVLoader(BaseLoader):
         exclude: list[str],
         variables: "SourceVariableSet",
         read_params: dict | None = None,
+        chunk_rows: int | None = 500_000,
     ) -> None:
         if read_params is None:
             self._read_params = {}
         else:
             self._read_params = read_params
+        self._chunk_rows = chunk_rows
         super().__init__(
             provider_name=provider_name,
             category=category,
@@ -52,24 +63,53 @@ class CSVLoader(BaseLoader):
             variables=variables,
         )
 
-    def _read(self, filepath: Path) -> pd.DataFrame:
-        """Read csv files, using self._read_params when loading files.
+    def _read_chunks(self, filepath: Path) -> "Iterator[pd.DataFrame]":
+        """Read csv files by chunks, using self._read_params when loading files.
 
         Parameters
         ----------
         filepath : Path
             CSV filepath.
 
-        Returns
-        -------
-        pd.DataFrame
-            Raw data from the csv file.
+        Yields
+        ------
+        Iterator[pd.DataFrame]
+            Chunks of raw data from the csv file.
         """
+        read_params = {
+            "usecols": self._columns_to_read.__contains__,
+            "memory_map": True,
+        }
+        read_params.update(self._read_params)
+        if self._chunk_rows is not None:
+            read_params["chunksize"] = self._chunk_rows
         try:
-            file = pd.read_csv(filepath, **self._read_params)
+            file = pd.read_csv(filepath, **read_params)
         except EmptyDataError:
-            file = pd.DataFrame(columns=[x.label for x in self._variables.in_dset])
-        return file
+            yield pd.DataFrame(columns=[x.label for x in self._variables.in_dset])
+            return
+        if self._chunk_rows is None:
+            yield file
+            return
+        with file as reader:
+            yield from reader
+
+    @cached_property
+    def _columns_to_read(self) -> frozenset[str]:
+        """Names of the columns which can be used to load the data, resolved once.
+
+        Returns
+        -------
+        frozenset[str]
+            Aliases and flag aliases of all variables in the dataset.
+        """
+        columns = set()
+        for var in self._variables.in_dset:
+            for alias, flag_alias, _ in var.aliases:
+                columns.add(alias)
+                if flag_alias is not None:
+                    columns.add(flag_alias)
+        return frozenset(columns)
 
     def _filter_flags(self, df: pd.DataFrame, var: "ExistingVar") -> pd.Series:
         """Filter data selecting only some flag values.
@@ -119,41 +159,52 @@ class CSVLoader(BaseLoader):
             if values is not None:
                 data[var.label] = values
         clean_df = pd.DataFrame(data)
+        labels = self._labels
         if self._variables.has_provider:
-            provider_var_name = self._variables.provider_var_name
-            clean_df[self._variables.get(provider_var_name).label] = self._provider
-        if self._variables.get(self._variables.date_var_name).label in clean_df.columns:
+            clean_df[labels["provider"]] = self._provider
+        date_var_label = labels["date"]
+        if date_var_label in clean_df.columns:
             # Convert Date column to datetime (if existing)
-            date_label = self._variables.get(self._variables.date_var_name).label
-            raw_date_col = clean_df.pop(date_label).astype(str)
-            dates = pd.to_datetime(raw_date_col, infer_datetime_format=True)
+            raw_date_col = clean_df.pop(date_var_label).astype(str)
+            # Parse each distinct date string only once
+            codes, uniques = pd.factorize(raw_date_col)
+            parsed = pd.to_datetime(uniques, infer_datetime_format=True)
+            dates = pd.Series(parsed.take(codes), index=raw_date_col.index)
+            date_columns = {
+                labels["year"]: dates.dt.year,
+                labels["month"]: dates.dt.month,
+                labels["day"]: dates.dt.day,
+            }
             if self._variables.has_hour:
-                hour_label = self._variables.get(self._variables.hour_var_name).label
-                clean_df.insert(0, hour_label, dates.dt.hour)
-            day_label = self._variables.get(self._variables.day_var_name).label
-            clean_df.insert(0, day_label, dates.dt.day)
-            month_label = self._variables.get(self._variables.month_var_name).label
-            clean_df.insert(0, month_label, dates.dt.month)
-            year_label = self._variables.get(self._variables.year_var_name).label
-            clean_df.insert(0, year_label, dates.dt.year)
+                date_columns[labels["hour"]] = dates.dt.hour
+            clean_df = pd.concat(
+                [pd.DataFrame(date_columns), clean_df],
+                axis=1,
+                copy=False,
+            )
         else:
-            dates = pd.to_datetime(
-                clean_df[
-                    [
-                        self._variables.get(self._variables.year_var_name).label,
-                        self._variables.get(self._variables.month_var_name).label,
-                        self._variables.get(self._variables.day_var_name).label,
-                    ]
-                ],
+            # Assemble the dates as yyyymmdd numbers, parsing each of them only once
+            years = pd.to_numeric(clean_df[labels["year"]])
+            months = pd.to_numeric(clean_df[labels["month"]])
+            days = pd.to_numeric(clean_df[labels["day"]])
+            codes, uniques = pd.factorize(
+                years * 10000 + months * 100 + days,
+                use_na_sentinel=False,
             )
-        date_var_label = self._variables.get(self._variables.date_var_name).label
+            parsed = pd.to_datetime(pd.Series(uniques), format="%Y%m%d").to_numpy()
+            dates = pd.Series(parsed[codes], index=clean_df.index)
         clean_df.loc[:, date_var_label] = dates
+        missing = {}
         for var in self._variables:
             if var.label in clean_df.columns:
                 clean_df.loc[pd.isna(clean_df[var.label]), var.label] = var.default
             else:
-                clean_df[var.label] = var.default
-        return clean_df
+                missing[var.label] = var.default
+        if not missing:
+            return clean_df
+        # create missing columns, as a single block
+        missing_columns = pd.DataFrame(missing, index=clean_df.index)
+        return pd.concat([clean_df, missing_columns], axis=1, copy=False)
 
     def _convert_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Type converting function, modified to behave with csv files.
@@ -169,29 +220,30 @@ class CSVLoader(BaseLoader):
             Type converted Dataframe.
         """
         # Checking for outliers : change "<0,05" into "0,05" (example)
-        wrong_format_columns = df.apply(
-            lambda x: x.astype(str).str.contains("<").sum() > 0,
-            axis=0,
-        )
-        if wrong_format_columns.any():
-            correction_func = (
-                lambda x: float(str(x)[1:]) if str(x)[0] == "<" else float(x)
-            )
-            corrected = df.loc[:, wrong_format_columns].applymap(correction_func)
-            df.loc[:, wrong_format_columns] = corrected
-        # Modify type :
+        # Only columns of objects can hold such strings
+        for label in df.columns[df.dtypes == object]:
+            as_str = df[label].astype(str)
+            if as_str.str.contains("<", regex=False).any():
+                df[label] = as_str.str.removeprefix("<").astype(float)
+        to_drop = np.zeros(df.shape[0], dtype=bool)
         for var in self._variables:
-            if var.type is not str:
+            column = df[var.label]
+            # numeric and datetime values can't contain letters
+            if var.type is not str and column.dtype.kind not in "fiuM":
                 # if there are letters in the values
-                alpha_values = df[var.label].astype(str).str.isalpha()
+                alpha_values = column.astype(str).str.isalpha().to_numpy()
                 # if the value is nan (keep the "nan" values flagged at previous line)
-                nan_values = df[var.label].isnull()
-                # removing these rows
-                df = df.loc[~(alpha_values & (~nan_values)), :]
-                df[var.label] = df[var.label].astype(var.type)
-            else:
-                df[var.label] = df[var.label].astype(var.type).str.strip()
-        return df
+                nan_values = column.isnull().to_numpy()
+                to_drop |= alpha_values & (~nan_values)
+        # removing these rows
+        if to_drop.any():
+            df = df.take(np.flatnonzero(~to_drop))
+        # Modify type :
+        # strings are converted while being stripped
+        typed = df.astype(self._prepared_dtypes, copy=False)
+        for label in self._str_labels:
+            typed[label] = self._to_stripped_strings(typed[label])
+        return typed
 
     def load(
         self,
@@ -214,9 +266,37 @@ class CSVLoader(BaseLoader):
         """
         if constraints is None:
             constraints = Constraints()
-        df_raw = self._read(Path(filepath))
+        # Chunks are filtered as soon as they are read to limit memory usage
+        chunks = [
+            self._process_chunk(df_raw, constraints)
+            for df_raw in self._read_chunks(Path(filepath))
+        ]
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, axis=0, copy=False)
+
+    def _process_chunk(
+        self,
+        df_raw: pd.DataFrame,
+        constraints: Constraints,
+    ) -> pd.DataFrame:
+        """Format, convert, correct and filter a chunk of raw data.
+
+        Parameters
+        ----------
+        df_raw : pd.DataFrame
+            Raw data chunk.
+        constraints : Constraints
+            Constraints slicer.
+
+        Returns
+        -------
+        pd.DataFrame
+            Processed chunk.
+        """
         df_form = self._format(df_raw)
-        df_type = self._convert_types(df_form)
+        df_dates_sliced = self._apply_date_constraint(df_form, constraints)
+        df_type = self._convert_types(df_dates_sliced)
         df_corr = self._correct(df_type)
         df_sliced = constraints.apply_constraints_to_dataframe(df_corr)
         return self.remove_nan_rows(df_sliced)
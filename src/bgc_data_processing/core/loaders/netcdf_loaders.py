@@ -2,6 +2,7 @@
 
 import datetime as dt
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -43,6 +44,8 @@ class NetCDFLoader(BaseLoader):
     _date_format: str = "%Y-%m-%d"
     _time_format: str = "%H:%M:%S"
     _default_time: str = "00:00:00"
+    _date_pattern: re.Pattern = re.compile(_date_regex)
+    _time_pattern: re.Pattern = re.compile(_time_regex)
 
     def __init__(
         self,
@@ -90,7 +93,10 @@ class NetCDFLoader(BaseLoader):
         netCDF4.Dataset
             File content stored in a netCDF4.Dataset object.
         """
-        return netCDF4.Dataset(filepath)
+        nc_data = netCDF4.Dataset(filepath)
+        # Only build masked arrays for variables which actually have missing values
+        nc_data.set_always_mask(False)
+        return nc_data
 
     def _get_shapes(self, data_dict: dict[str, np.ndarray]) -> tuple[int]:
         """Return the data shapes of the variables.
@@ -178,9 +184,9 @@ class NetCDFLoader(BaseLoader):
         var_ref = [var for var in self.variables.in_dset if var not in missing_vars][0]
         shape_ref = data_dict[var_ref.label].shape
         for var in missing_vars:
-            # Create empty frame with nans
-            data_dict[var.label] = np.empty(shape_ref)
-            data_dict[var.label].fill(var.default)
+            # Constant read-only view, only materialized when flattening the data
+            default = np.array(var.default, dtype=float)
+            data_dict[var.label] = np.broadcast_to(default, shape_ref)
         return data_dict
 
     def _reshape_data(self, data_dict: dict) -> dict:
@@ -202,10 +208,10 @@ class NetCDFLoader(BaseLoader):
             data = data_dict[var.label]
             if data.shape == (1,):
                 # data contains a single value => from CMEMS: latitude or longitude
-                data = np.tile(data, (shape0,))
+                data = np.broadcast_to(data, (shape0,))
             if len(data.shape) == 1:
-                # Reshape data to 2D
-                data = np.tile(data.reshape((shape0, 1)), (1, shape1))
+                # Reshape data to 2D (as a view, values are only copied by flatten)
+                data = np.broadcast_to(data.reshape((shape0, 1)), (shape0, shape1))
             # Flatten 2D data
             reshaped[var.label] = data.flatten()
         return reshaped
@@ -239,17 +245,17 @@ class NetCDFLoader(BaseLoader):
             else:
                 values = nc_data.variables[alias][:]
                 # Convert masked_array to ndarray
-                values: np.ndarray = values.filled(np.nan)
+                values: np.ndarray = np.ma.filled(values, np.nan)
             if (flag is not None) and (flag in file_keys):
                 # get flag values from file
                 flag_values = nc_data.variables[flag][:]
                 # Fill with an integer => careful not to use an integer in the flags
-                flag_values: np.ndarray = flag_values.filled(-1)
-                good_flags = np.empty(values.shape, dtype=bool)
-                good_flags.fill(False)
-                for value in correct_flags:
-                    good_flags = good_flags | (flag_values == value)
-                return np.where(good_flags, values, np.nan)
+                flag_values: np.ndarray = np.ma.filled(flag_values, -1)
+                bad_flags = np.isin(flag_values, correct_flags, invert=True)
+                if values.dtype.kind != "f" or values.shape != bad_flags.shape:
+                    return np.where(bad_flags, np.nan, values)
+                # values is a fresh array: invalid values are replaced in place
+                np.putmask(values, bad_flags, np.nan)
             return values
         return None
 
@@ -273,7 +279,9 @@ class NetCDFLoader(BaseLoader):
             if values is None:
                 missing_vars.append(var)
                 continue
-            values[np.isnan(values)] = var.default
+            if not pd.isna(var.default):
+                # flagged and masked values are already nan
+                values[np.isnan(values)] = var.default
             data_dict[var.label] = values
         nc_data.close()
         # Add missing columns
@@ -295,28 +303,51 @@ class NetCDFLoader(BaseLoader):
         np.ndarray
             Adjusted values
         """
-        units = variable.units
-        date_search = re.search(self._date_regex, units)
-        time_search = re.search(self._time_regex, units)
+        offset = self._get_offset(variable.units)
+        data: np.ndarray | np.ma.MaskedArray = variable[:]
+        values: np.ndarray = np.ma.filled(data, np.nan).astype(float, copy=False)
+        # nan values remain nan
+        values += offset
+        return values
+
+    @classmethod
+    @lru_cache
+    def _get_offset(cls, units: str) -> float:
+        """Compute the offset (in days) between the time unit origin and _date_start.
+
+        Results are cached since most files share the same time unit.
+
+        Parameters
+        ----------
+        units : str
+            Time unit of the date variable.
+
+        Returns
+        -------
+        float
+            Number of days to add to the values to make them start at _date_start.
+
+        Raises
+        ------
+        NetCDFLoadingError
+            If the time unit doesn't contain any date.
+        """
+        date_search = cls._date_pattern.search(units)
+        time_search = cls._time_pattern.search(units)
 
         if date_search is None:
             error_msg = f"Impossible to find date from time unit: {units}"
             raise NetCDFLoadingError(error_msg)
         date_slice = date_search.group(0)
 
-        time_slice = self._default_time if time_search is None else time_search.group(0)
+        time_slice = cls._default_time if time_search is None else time_search.group(0)
 
         date_start = dt.datetime.strptime(
             f"{date_slice} {time_slice}",
-            f"{self._date_format} {self._time_format}",
+            f"{cls._date_format} {cls._time_format}",
         )
-
-        data: np.ma.MaskedArray = variable[:]
-        values: np.ndarray = data.filled(np.nan)
-        offset_diff = date_start - self._date_start
-        nans = np.isnan(values)
-        values[~nans] = values[~nans] + offset_diff.total_seconds() / 86400
-        return values
+        offset_diff = date_start - cls._date_start
+        return offset_diff.total_seconds() / 86400
 
     def _set_dates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Set the dates (and year, month, day) columns in the dataframe.
@@ -332,16 +363,18 @@ class NetCDFLoader(BaseLoader):
             Dataframe with date, year, month and day columns.
         """
         # Convert from timedeltas to datetime
-        date_var_label = self.variables.get(self._variables.date_var_name).label
-        timedeltas = df.pop(date_var_label)
+        labels = self._labels
+        date_var_label = labels["date"]
+        timedeltas = df.pop(date_var_label).to_numpy()
+        # DatetimeIndex fields are computed without boxing into Series accessors
         dates = pd.to_timedelta(timedeltas, "D") + self._date_start
         df[date_var_label] = dates
         # Add year, month and day columns
-        df[self.variables.get(self._variables.year_var_name).label] = dates.dt.year
-        df[self.variables.get(self._variables.month_var_name).label] = dates.dt.month
-        df[self.variables.get(self._variables.day_var_name).label] = dates.dt.day
+        df[labels["year"]] = dates.year
+        df[labels["month"]] = dates.month
+        df[labels["day"]] = dates.day
         if self._variables.has_hour:
-            df[self.variables.get(self._variables.hour_var_name).label] = dates.dt.hour
+            df[labels["hour"]] = dates.hour
         return df
 
     def _set_provider(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -358,8 +391,7 @@ class NetCDFLoader(BaseLoader):
             Dataframe with provider column properly filled.
         """
         if self._variables.has_provider:
-            provider_var_name = self._variables.provider_var_name
-            df.insert(0, self._variables.get(provider_var_name).label, self.provider)
+            df.insert(0, self._labels["provider"], self.provider)
         return df
 
     def _set_expocode(self, df: pd.DataFrame, file_id: str) -> pd.DataFrame:
@@ -377,8 +409,7 @@ class NetCDFLoader(BaseLoader):
         pd.DataFrame
             Dataframe with expocode column properly filled.
         """
-        expocode_var_name = self._variables.expocode_var_name
-        df.insert(0, self._variables.get(expocode_var_name).label, file_id)
+        df.insert(0, self._labels["expocode"], file_id)
         return df
 
     def _add_empty_cols(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -394,10 +425,12 @@ class NetCDFLoader(BaseLoader):
         pd.DataFrame
             Dataframe with all wished columns (for every variable in self._variable).
         """
-        for var in self._variables:
-            if var.label not in df.columns:
-                df.insert(len(df.columns), var.label, np.nan)
-        return df
+        missing = [var.label for var in self._variables if var.label not in df.columns]
+        if not missing:
+            return df
+        # create missing columns, as a single block
+        empty_columns = pd.DataFrame(np.nan, index=df.index, columns=missing)
+        return pd.concat([df, empty_columns], axis=1, copy=False)
 
     def _convert_type(self, df: pd.DataFrame) -> pd.DataFrame:
         """Convert columns types to the types specified for the variables.
@@ -412,10 +445,9 @@ class NetCDFLoader(BaseLoader):
         pd.DataFrame
             Dataframe with wished types.
         """
-        for var in self._variables:
-            correct_type = df.pop(var.label).astype(var.type)
-            df.insert(len(df.columns), var.label, correct_type)
-        return df
+        labels = [var.label for var in self._variables]
+        dtypes = {**self._prepared_dtypes, **dict.fromkeys(self._str_labels, str)}
+        return df[labels].astype(dtypes, copy=False)
 
     def load(
         self,
@@ -442,10 +474,7 @@ class NetCDFLoader(BaseLoader):
         nc_data = self._read(filepath=Path(filepath))
         df_format = self._format(nc_data)
         df_dates = self._set_dates(df_format)
-        df_dates_sliced = constraints.apply_specific_constraint(
-            field_label=self._variables.get(self._variables.date_var_name).label,
-            df=df_dates,
-        )
+        df_dates_sliced = self._apply_date_constraint(df_dates, constraints)
         df_prov = self._set_provider(df_dates_sliced)
         df_expo = self._set_expocode(df_prov, file_id)
         df_ecols = self._add_empty_cols(df_expo)
@@ -538,7 +567,7 @@ class SatelliteNetCDFLoader(NetCDFLoader):
         expocode_var_name = self._variables.expocode_var_name
         df.insert(
             0,
-            self._variables.get(expocode_var_name).label,
+            self._labels["expocode"],
             self._variables.get(expocode_var_name).default,
         )
         return df
@@ -574,15 +603,16 @@ class SatelliteNetCDFLoader(NetCDFLoader):
                 continue
             if not dims_included:
                 dat_3d, lat_3d, lon_3d = self._load_dimensions_vars(nc_data=nc_data)
-                dat_label = variables.get(variables.date_var_name).label
-                data_dict[dat_label] = np.broadcast_to(dat_3d, values.shape).ravel()
-                lat_label = variables.get(variables.latitude_var_name).label
-                data_dict[lat_label] = np.broadcast_to(lat_3d, values.shape).ravel()
-                lon_label = variables.get(variables.longitude_var_name).label
-                data_dict[lon_label] = np.broadcast_to(lon_3d, values.shape).ravel()
+                labels = self._labels
+                shape = values.shape
+                data_dict[labels["date"]] = np.broadcast_to(dat_3d, shape).ravel()
+                data_dict[labels["latitude"]] = np.broadcast_to(lat_3d, shape).ravel()
+                data_dict[labels["longitude"]] = np.broadcast_to(lon_3d, shape).ravel()
                 dims_included = True
             values = values.ravel()
-            values[np.isnan(values)] = var.default
+            if not pd.isna(var.default):
+                # flagged and masked values are already nan
+                values[np.isnan(values)] = var.default
             data_dict[var.label] = values
         nc_data.close()
         # Add missing columns
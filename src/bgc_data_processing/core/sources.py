@@ -1,27 +1,56 @@
 """Data Source objects."""
 
-from copy import deepcopy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from bgc_data_processing.core.io.savers import StorerSaver
-from bgc_data_processing.core.loaders.abfile_loaders import ABFileLoader
-from bgc_data_processing.core.loaders.csv_loaders import CSVLoader
-from bgc_data_processing.core.loaders.netcdf_loaders import (
-    NetCDFLoader,
-    SatelliteNetCDFLoader,
-)
 from bgc_data_processing.core.storers import Storer
 from bgc_data_processing.exceptions import UnsupportedLoadingFormatError
 from bgc_data_processing.verbose import with_verbose
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from bgc_data_processing.core.filtering import Constraints
     from bgc_data_processing.core.loaders.base import BaseLoader
     from bgc_data_processing.core.variables.sets import SourceVariableSet
-    from bgc_data_processing.utils.dateranges import DateRangeGenerator
+    from bgc_data_processing.utils.dateranges import DateRange, DateRangeGenerator
     from bgc_data_processing.utils.patterns import FileNamePattern
 
+# Loaders classes by loading key: (module name, class name)
+_LOADERS_CLASSES: dict[str, tuple[str, str]] = {
+    "csv": ("csv_loaders", "CSVLoader"),
+    "netcdf": ("netcdf_loaders", "NetCDFLoader"),
+    "satellite_netcdf": ("netcdf_loaders", "SatelliteNetCDFLoader"),
+    "abfiles": ("abfile_loaders", "ABFileLoader"),
+}
+
+
+@lru_cache
+def _get_loader_class(loader_key: str) -> type["BaseLoader"]:
+    """Import the loader class corresponding to a loading key.
+
+    Loaders modules are only imported when needed, which avoids importing \
+    the backends (netCDF4 for example) of unused formats.
+
+    Parameters
+    ----------
+    loader_key : str
+        Key of the loader in _LOADERS_CLASSES.
+
+    Returns
+    -------
+    type[BaseLoader]
+        Loader class.
+    """
+    module_name, class_name = _LOADERS_CLASSES[loader_key]
+    module = import_module(f"bgc_data_processing.core.loaders.{module_name}")
+    return getattr(module, class_name)
+
 
 class DataSource:
     """Data Source.
@@ -44,6 +73,20 @@ class DataSource:
         Ensembles of variables to consider.
     """
 
+    __slots__ = (
+        "_format",
+        "_category",
+        "_vars_ensemble",
+        "_store_vars",
+        "_files_pattern",
+        "_dirin",
+        "_provider",
+        "_read_kwargs",
+        "_prov_name",
+        "_excl",
+        "_loader",
+    )
+
     def __init__(
         self,
         provider_name: str,
@@ -71,6 +114,9 @@ class DataSource:
     def as_template(self) -> dict[str, Any]:
         """Create template to easily re-create a similar data source.
 
+        The variable ensemble is shared with the template, not copied, \
+        it must therefore not be modified by the template's user.
+
         Returns
         -------
         dict[str, Any]
@@ -83,7 +129,7 @@ class DataSource:
             "data_category": self._category,
             "excluded_files": self._loader.excluded_filenames,
             "files_pattern": self._files_pattern,
-            "variable_ensemble": deepcopy(self._vars_ensemble),
+            "variable_ensemble": self._vars_ensemble,
         }
         for key, value in self._read_kwargs.items():
             base_parameters[key] = value
@@ -165,39 +211,20 @@ class DataSource:
         UnsupportedLoadingFormatError
             If the file format is not supported.
         """
-        if self._format == "csv":
-            return CSVLoader(
-                provider_name=provider_name,
-                category=self._category,
-                exclude=excluded_files,
-                variables=self._vars_ensemble.loading_variables,
-                **self._read_kwargs,
-            )
         if self._format == "netcdf" and self._category == "satellite":
-            return SatelliteNetCDFLoader(
-                provider_name=provider_name,
-                category=self._category,
-                exclude=excluded_files,
-                variables=self._vars_ensemble.loading_variables,
-                **self._read_kwargs,
-            )
-        if self._format == "netcdf":
-            return NetCDFLoader(
-                provider_name=provider_name,
-                category=self._category,
-                exclude=excluded_files,
-                variables=self._vars_ensemble.loading_variables,
-                **self._read_kwargs,
-            )
-        if self._format == "abfiles":
-            return ABFileLoader(
-                provider_name=provider_name,
-                category=self._category,
-                exclude=excluded_files,
-                variables=self._vars_ensemble.loading_variables,
-                **self._read_kwargs,
-            )
-        raise UnsupportedLoadingFormatError(self._format)
+            loader_key = "satellite_netcdf"
+        else:
+            loader_key = self._format
+        if loader_key not in _LOADERS_CLASSES:
+            raise UnsupportedLoadingFormatError(self._format)
+        loader_class = _get_loader_class(loader_key)
+        return loader_class(
+            provider_name=provider_name,
+            category=self._category,
+            exclude=excluded_files,
+            variables=self._vars_ensemble.loading_variables,
+            **self._read_kwargs,
+        )
 
     def _insert_all_features(self, storer: "Storer") -> None:
         """Insert all features in a storer.
@@ -220,12 +247,18 @@ class DataSource:
         storer : Storer
             Storer to remove variables from
         """
-        to_remove = [x for x in storer.variables if not self.variables.has_name(x.name)]
-        for var in to_remove:
-            _ = storer.pop(var.name)
+        to_remove = [
+            x.name for x in storer.variables if not self.variables.has_name(x.name)
+        ]
+        storer.drop_variables(to_remove)
 
     @with_verbose(trigger_threshold=0, message="Loading data from [filepath]")
-    def _create_storer(self, filepath: Path, constraints: "Constraints") -> "Storer":
+    def _create_storer(
+        self,
+        filepath: Path,
+        constraints: "Constraints",
+        dateranges: "DateRange | None" = None,
+    ) -> "Storer":
         """Create the storer with the data from a given filepath.
 
         Parameters
@@ -234,6 +267,10 @@ class DataSource:
             Path to the file to load data from.
         constraints : Constraints
             Constraints to apply on the storer.
+        dateranges : DateRange | None, optional
+            Dateranges the storer will be sliced on, if given, rows outside \
+            of the dateranges are removed before computing the features., \
+            by default None
 
         Returns
         -------
@@ -247,15 +284,99 @@ class DataSource:
             providers=[self.loader.provider],
             variables=self._store_vars,
         )
+        if dateranges is not None:
+            storer = self._restrict_to_dateranges(storer, dateranges)
         self._insert_all_features(storer)
         self._remove_temporary_variables(storer)
         return storer
 
+    def _restrict_to_dateranges(
+        self,
+        storer: "Storer",
+        dateranges: "DateRange",
+    ) -> "Storer":
+        """Only keep the rows which can belong to one of the dateranges.
+
+        Parameters
+        ----------
+        storer : Storer
+            Storer to restrict.
+        dateranges : DateRange
+            Dateranges the storer will be sliced on.
+
+        Returns
+        -------
+        Storer
+            Storer with the rows between the first start date and the last end date.
+        """
+        date_label = self._vars_ensemble.get(self._vars_ensemble.date_var_name).label
+        dates = storer.data[date_label]
+        in_range = (dates >= dateranges.start_dates.min()) & (
+            dates <= dateranges.end_dates.max()
+        )
+        if in_range.all():
+            return storer
+        return Storer(
+            data=storer.data.loc[in_range],
+            category=storer.category,
+            providers=storer.providers,
+            variables=storer.variables,
+        )
+
+    def _iter_storers(
+        self,
+        filepaths: list[Path],
+        constraints: "Constraints",
+        prefetch: bool,
+        dateranges: "DateRange | None" = None,
+    ) -> "Iterator[Storer]":
+        """Iterate over the storers of the given files.
+
+        Parameters
+        ----------
+        filepaths : list[Path]
+            Paths of the files to load.
+        constraints : Constraints
+            Constraints to apply on the storers.
+        prefetch : bool
+            Whether to load the next file in a background thread \
+            while the current storer is being processed.
+        dateranges : DateRange | None, optional
+            Dateranges the storers will be sliced on., by default None
+
+        Yields
+        ------
+        Iterator[Storer]
+            Storer of each file.
+        """
+        create_storer = partial(
+            self._create_storer,
+            constraints=constraints,
+            dateranges=dateranges,
+        )
+        if not prefetch:
+            for filepath in filepaths:
+                yield create_storer(filepath=filepath)
+            return
+        # A single loading thread: files are still loaded one at a time
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = deque(
+                executor.submit(create_storer, filepath=filepath)
+                for filepath in filepaths[:1]
+            )
+            for filepath in filepaths[1:]:
+                storer = pending.popleft().result()
+                pending.append(executor.submit(create_storer, filepath=filepath))
+                yield storer
+            while pending:
+                yield pending.popleft().result()
+
     def load_and_save(
         self,
         saving_directory: Path | str,
         dateranges_gen: "DateRangeGenerator",
         constraints: "Constraints",
+        prefetch: bool = True,
     ) -> None:
         """Save data in files as soon as the data is loaded to relieve memory.
 
@@ -267,6 +388,9 @@ class DataSource:
             Generator to use to retrieve dateranges.
         constraints : Constraints
             Contraints ot apply on data.
+        prefetch : bool, optional
+            Whether to load the next file while saving the current one, \
+            by default True.
         """
         date_label = self._vars_ensemble.get(self._vars_ensemble.date_var_name).label
         date_constraint = constraints.get_constraint_parameters(date_label)
@@ -275,8 +399,14 @@ class DataSource:
         filepaths = pattern_matcher.select_matching_filepath(
             research_directory=self._dirin,
         )
-        for filepath in filepaths:
-            storer = self._create_storer(filepath=filepath, constraints=constraints)
+        # Features are only computed for the rows which will be saved
+        storers = self._iter_storers(
+            filepaths=filepaths,
+            constraints=constraints,
+            prefetch=prefetch,
+            dateranges=dateranges_gen(),
+        )
+        for storer in storers:
             saver = StorerSaver(storer)
             saver.save_from_daterange(
                 dateranges_gen=dateranges_gen,
@@ -303,8 +433,18 @@ class DataSource:
         filepaths = pattern_matcher.select_matching_filepath(
             research_directory=self._dirin,
         )
-        storers = []
-        for filepath in filepaths:
-            storer = self._create_storer(filepath=filepath, constraints=constraints)
-            storers.append(storer)
-        return sum(storers)
+        max_workers = max(1, min(self.loader.max_loading_threads, len(filepaths)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._create_storer,
+                    filepath=filepath,
+                    constraints=constraints,
+                )
+                for filepath in filepaths
+            ]
+            storers = [future.result() for future in futures]
+        if not storers:
+            # Neutral element of the storers' addition
+            return 0
+        return Storer.concat(storers)
@@ -2,7 +2,7 @@
 
 
 import datetime as dt
-from copy import deepcopy
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -38,6 +38,16 @@ class Storer:
         Variables storer of object to keep track of the variables in the Dataframe.
     """
 
+    __slots__ = (
+        "_data",
+        "_category",
+        "_providers",
+        "_variables",
+        "_sorted_dates_cache",
+        "_dedup_subset_within_cache",
+        "_dedup_subset_between_cache",
+    )
+
     def __init__(
         self,
         data: pd.DataFrame,
@@ -48,7 +58,10 @@ class Storer:
         self._data = data
         self._category = category
         self._providers = providers
-        self._variables = deepcopy(variables)
+        self._variables = variables.clone()
+        self._sorted_dates_cache: tuple[np.ndarray, np.ndarray] | None = None
+        self._dedup_subset_within_cache: list[str] | None = None
+        self._dedup_subset_between_cache: list[str] | None = None
 
     @property
     def data(self) -> pd.DataFrame:
@@ -161,25 +174,132 @@ class Storer:
         if not isinstance(other, Storer):
             error_msg = f"Can't add CSVStorer object to {type(other)}"
             raise TypeError(error_msg)
-        # Assert variables are the same
-        if self.variables != other.variables:
-            error_msg = "Variables or categories are not compatible"
-            raise IncompatibleVariableSetsError(error_msg)
-        # Assert categories are the same
-        if self.category != other.category:
-            error_msg = "Categories are not compatible"
-            raise IncompatibleCategoriesError(error_msg)
-
-        concat_data = pd.concat([self._data, other.data], ignore_index=True)
-        concat_providers = list(set(self.providers + other.providers))
+        return Storer.concat([self, other])
+
+    @classmethod
+    def concat(cls, storers: list["Storer"]) -> "Storer":
+        """Concatenate storers with a single concatenation of their data.
+
+        Parameters
+        ----------
+        storers : list[Storer]
+            Storers to concatenate.
+
+        Returns
+        -------
+        Storer
+            Storer aggregating all storers' data.
+
+        Raises
+        ------
+        ValueError
+            If there is no storer to concatenate.
+        IncompatibleVariableSetsError
+            If the storers have different variable sets.
+        IncompatibleCategoriesError
+            If the storers have different categories.
+        """
+        if not storers:
+            error_msg = "No storer to concatenate."
+            raise ValueError(error_msg)
+        reference = storers[0]
+        for storer in storers[1:]:
+            # Assert variables are the same
+            if storer.variables != reference.variables:
+                error_msg = "Variables or categories are not compatible"
+                raise IncompatibleVariableSetsError(error_msg)
+            # Assert categories are the same
+            if storer.category != reference.category:
+                error_msg = "Categories are not compatible"
+                raise IncompatibleCategoriesError(error_msg)
+        data = pd.concat(
+            [storer.data for storer in storers],
+            ignore_index=True,
+            copy=False,
+        )
+        providers = set(chain.from_iterable(storer.providers for storer in storers))
         # Return Storer with similar variables
         return Storer(
-            data=concat_data,
-            category=self.category,
-            providers=concat_providers,
-            variables=self.variables,
+            data=data,
+            category=reference.category,
+            providers=list(providers),
+            variables=reference.variables,
         )
 
+    def _get_existing_labels(self, names: list[str]) -> list[str]:
+        """Return the labels of the variables with the given names, if they exist.
+
+        Parameters
+        ----------
+        names : list[str]
+            Names of the variables.
+
+        Returns
+        -------
+        list[str]
+            Labels of the variables existing in the storer.
+        """
+        return [
+            self._variables.get(name).label
+            for name in names
+            if self._variables.has_name(name)
+        ]
+
+    @property
+    def _dedup_subset_within(self) -> list[str]:
+        """Labels to identify duplicates among a common provider.
+
+        Returns
+        -------
+        list[str]
+            Labels of the variables to group duplicates on.
+        """
+        if self._dedup_subset_within_cache is not None:
+            return self._dedup_subset_within_cache
+        grouping_vars = [
+            "PROVIDER",
+            "EXPOCODE",
+            "DATE",
+            "YEAR",
+            "MONTH",
+            "DAY",
+            "HOUR",
+            "LATITUDE",
+            "LONGITUDE",
+            "DEPH",
+        ]
+        self._dedup_subset_within_cache = self._get_existing_labels(grouping_vars)
+        return self._dedup_subset_within_cache
+
+    @property
+    def _dedup_subset_between(self) -> list[str]:
+        """Labels to identify duplicates between different providers.
+
+        Returns
+        -------
+        list[str]
+            Labels of the variables to group duplicates on.
+        """
+        if self._dedup_subset_between_cache is not None:
+            return self._dedup_subset_between_cache
+        grouping_vars = [
+            "EXPOCODE",
+            "YEAR",
+            "MONTH",
+            "DAY",
+            "HOUR",
+            "LATITUDE",
+            "LONGITUDE",
+            "DEPH",
+        ]
+        self._dedup_subset_between_cache = self._get_existing_labels(grouping_vars)
+        return self._dedup_subset_between_cache
+
+    def _reset_dedup_subsets(self) -> None:
+        """Reset the cached duplicates subsets when the variables change."""
+        self._dedup_subset_within_cache = None
+        self._dedup_subset_between_cache = None
+
     def remove_duplicates(self, priority_list: list | None = None) -> None:
         """Update self._data to remove duplicates in data.
 
@@ -193,6 +313,7 @@ class Storer:
         df = self._remove_duplicates_among_providers(df)
         df = self._remove_duplicates_between_providers(df, priority_list=priority_list)
         self._data = df
+        self._sorted_dates_cache = None
 
     def _remove_duplicates_among_providers(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove duplicates among a common providers.
@@ -207,35 +328,34 @@ class Storer:
         pd.DataFrame
             DataFrame without duplicates.
         """
-        grouping_vars = [
-            "PROVIDER",
-            "EXPOCODE",
-            "DATE",
-            "YEAR",
-            "MONTH",
-            "DAY",
-            "HOUR",
-            "LATITUDE",
-            "LONGITUDE",
-            "DEPH",
-        ]
-        subset_group = []
-        for name in grouping_vars:
-            if self._variables.has_name(name):
-                subset_group.append(self._variables.get(name).label)
+        subset_group = self._dedup_subset_within
         # Select dupliacted rows
         is_duplicated = df.duplicated(subset=subset_group, keep=False)
-        duplicates = df.filter(items=df[is_duplicated].index, axis=0)
+        if not is_duplicated.any():
+            return df.reset_index(drop=True)
+        duplicates = df.loc[is_duplicated]
         # Drop dupliacted rows from dataframe
-        dropped = df.drop(df[is_duplicated].index, axis=0)
-        # Group duplicates and average them
+        dropped = df.loc[~is_duplicated]
+        # Group on integer codes rather than on strings
+        codes, uniques = {}, {}
+        for label in subset_group:
+            if duplicates[label].dtype == object:
+                # Factorizing the array keeps the uniques as objects
+                codes[label], uniques[label] = pd.factorize(
+                    duplicates[label].to_numpy(),
+                    use_na_sentinel=False,
+                )
+        # Group duplicates and average them, groups are kept in order of appearance
         grouped = (
-            duplicates.groupby(subset_group, dropna=False)
+            duplicates.assign(**codes)
+            .groupby(subset_group, dropna=False, observed=True, sort=False)
             .mean(numeric_only=True)
             .reset_index()
         )
+        for label, label_uniques in uniques.items():
+            grouped[label] = label_uniques[grouped[label].to_numpy()]
         # Concatenate dataframe with droppped duplicates and duplicates averaged
-        return pd.concat([dropped, grouped], ignore_index=True, axis=0)
+        return pd.concat([dropped, grouped], ignore_index=True, axis=0, copy=False)
 
     def _remove_duplicates_between_providers(
         self,
@@ -264,20 +384,7 @@ class Storer:
             return df
         if len(providers) == 1:
             return df
-        grouping_vars = [
-            "EXPOCODE",
-            "YEAR",
-            "MONTH",
-            "DAY",
-            "HOUR",
-            "LATITUDE",
-            "LONGITUDE",
-            "DEPH",
-        ]
-        subset = []
-        for name in grouping_vars:
-            if self._variables.has_name(name):
-                subset.append(self._variables.get(name).label)
+        subset = self._dedup_subset_between
         # every row concerned by duplication of the variables in subset
         is_duplicated = df.duplicated(
             subset=subset,
@@ -285,15 +392,27 @@ class Storer:
         )
         if not is_duplicated.any():
             return df
-        # Sorting key function
+        duplicates = df.loc[is_duplicated]
         if priority_list is not None:
-            sort_func = np.vectorize(lambda x: priority_list.index(x))
+            # Sort on the providers' ranks, looked up in a dictionnary
+            priority_map = {provider: i for i, provider in enumerate(priority_list)}
+            ranks = duplicates[provider_label].map(priority_map)
+            if ranks.isna().any():
+                missing = set(duplicates.loc[ranks.isna(), provider_label])
+                error_msg = f"Providers {missing} are not in the priority list."
+                raise ValueError(error_msg)
+            order = np.argsort(ranks.to_numpy(), kind="stable")
         else:
-            sort_func = np.vectorize(lambda x: x)
-        duplicates = df.filter(df.loc[is_duplicated, :].index, axis=0)
-        duplicates.sort_values(provider_label, key=sort_func, inplace=True)
+            # Sort on the providers' names, missing providers last
+            codes, _ = pd.factorize(
+                duplicates[provider_label].to_numpy(),
+                sort=True,
+                use_na_sentinel=False,
+            )
+            order = np.argsort(codes, kind="stable")
+        duplicates = duplicates.take(order)
         to_dump = duplicates.duplicated(subset=subset, keep="first")
-        dump_index = duplicates[to_dump].index
+        dump_index = duplicates.index[to_dump.to_numpy()]
         return df.drop(dump_index, axis=0)
 
     @staticmethod
@@ -313,9 +432,27 @@ class Storer:
         """
         return
 
+    @property
+    def _sorted_dates(self) -> tuple[np.ndarray, np.ndarray]:
+        """Dates sorted in increasing order, computed once for all slices.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Positions of the sorted dates in the data, sorted dates.
+        """
+        if self._sorted_dates_cache is not None:
+            return self._sorted_dates_cache
+        date_label = self._variables.get(self._variables.date_var_name).label
+        dates = pd.to_datetime(self._data[date_label]).to_numpy()
+        # Missing dates (NaT) are sorted last, they are therefore never selected
+        order = np.argsort(dates, kind="stable")
+        self._sorted_dates_cache = (order, dates[order])
+        return self._sorted_dates_cache
+
     def slice_on_dates(
         self,
-        drng: pd.Series,
+        drng: pd.Series | dict[str, dt.datetime],
     ) -> "Slice":
         """Slice the Dataframe using the date column.
 
@@ -323,23 +460,31 @@ class Storer:
 
         Parameters
         ----------
-        drng : pd.Series
-            Two values Series, "start_date" and "end_date".
+        drng : pd.Series | dict[str, dt.datetime]
+            Two values Series (or dictionnary), "start_date" and "end_date".
 
         Returns
         -------
-        list
-            Indexes to use for slicing.
+        Slice
+            Slice with the indexes to use for slicing.
         """
         # Params
         start_date: dt.datetime = drng["start_date"]
         end_date: dt.datetime = drng["end_date"]
         self.slice_verbose(_start_date=start_date.date(), _end_date=end_date.date())
-        dates_col = self._data[self._variables.get(self._variables.date_var_name).label]
-        # slice
-        after_start = dates_col >= start_date
-        before_end = dates_col <= end_date
-        slice_index = dates_col.loc[after_start & before_end].index.values.tolist()
+        order, sorted_dates = self._sorted_dates
+        # slice, using binary searches on the sorted dates
+        start = sorted_dates.searchsorted(
+            pd.Timestamp(start_date).to_datetime64(),
+            side="left",
+        )
+        end = sorted_dates.searchsorted(
+            pd.Timestamp(end_date).to_datetime64(),
+            side="right",
+        )
+        # Keep the rows in the order of the data
+        positions = np.sort(order[start:end])
+        slice_index = self._data.index.to_numpy()[positions]
         return Slice(
             storer=self,
             slice_index=slice_index,
@@ -360,6 +505,7 @@ class Storer:
             Feature data.
         """
         self.variables.add_var(variable)
+        self._reset_dedup_subsets()
         self._data[variable.name] = data
 
     def pop(self, variable_name: str) -> pd.Series:
@@ -376,8 +522,24 @@ class Storer:
             Data of the corresponding variable.
         """
         var = self.variables.pop(variable_name)
+        self._reset_dedup_subsets()
         return self._data.pop(var.name)
 
+    def drop_variables(self, variable_names: list[str]) -> None:
+        """Remove the variables with the given names and their data at once.
+
+        Parameters
+        ----------
+        variable_names : list[str]
+            Names of the variables to remove.
+        """
+        if not variable_names:
+            return
+        labels = [self.variables.get(name).label for name in variable_names]
+        self.variables.remove_many(variable_names)
+        self._reset_dedup_subsets()
+        self._data = self._data.drop(columns=labels)
+
     @classmethod
     def from_constraints(
         cls,
@@ -434,14 +596,16 @@ class Slice(Storer):
     ----------
     storer : Storer
         Storer to slice.
-    slice_index : list
+    slice_index : list | np.ndarray
         Indexes to keep from the Storer dataframe.
     """
 
+    __slots__ = ("storer", "slice_index")
+
     def __init__(
         self,
         storer: Storer,
-        slice_index: list,
+        slice_index: list | np.ndarray,
     ) -> None:
         """Slice storing object, instance of Storer to inherit of the saving method.
 
@@ -449,7 +613,7 @@ class Slice(Storer):
         ----------
         storer : Storer
             Storer to slice.
-        slice_index : list
+        slice_index : list | np.ndarray
             Indexes to keep from the Storer dataframe.
         """
         self.slice_index = slice_index
@@ -492,7 +656,7 @@ class Slice(Storer):
         pd.DataFrame
             The dataframe which the slice comes from.
         """
-        return self.storer.data.loc[self.slice_index, :]
+        return self.storer.data.loc[self.slice_index]
 
     def __repr__(self) -> str:
         """Represent self as a string.
@@ -525,5 +689,5 @@ class Slice(Storer):
         if self.storer != __o.storer:
             error_msg = "Addition can only be performed with slice from same CSVStorer"
             raise DifferentSliceOriginError(error_msg)
-        new_index = list(set(self.slice_index).union(set(__o.slice_index)))
+        new_index = np.union1d(self.slice_index, __o.slice_index)
         return Slice(self.storer, new_index)
@@ -2,9 +2,9 @@
 import itertools
 from collections.abc import Callable, Iterator
 from copy import copy, deepcopy
+from functools import cached_property
 from typing import TypeAlias
 
-import numpy as np
 from _collections_abc import dict_keys
 
 from bgc_data_processing.core.variables.vars import (
@@ -70,10 +70,28 @@ class VariableSet:
             List of all elements.
         """
         self._elements: list[FromFileVariables | ParsedVar] = copy(elements)
+        self.__dict__.pop("signature", None)
         self._save = [var.name for var in elements]
         self._in_dset = [var for var in self._elements if var.exist_in_dset]
         self._not_in_dset = [var for var in self._elements if not var.exist_in_dset]
 
+    def clone(self) -> "VariableSet":
+        """Copy the set, without copying the variables.
+
+        Cheaper alternative to deepcopy, attributes which are lists, \
+        dictionnaries or sets are copied, the variables are shared.
+
+        Returns
+        -------
+        VariableSet
+            Copy of the set.
+        """
+        new_set = copy(self)
+        for name, value in self.__dict__.items():
+            if isinstance(value, list | dict | set):
+                setattr(new_set, name, copy(value))
+        return new_set
+
     def __getitem__(self, __k: str) -> FromFileVariables:
         """Get variable by its name.
 
@@ -143,17 +161,21 @@ class VariableSet:
         """
         if not isinstance(__o, VariableSet):
             return False
+        return self.signature == __o.signature
 
-        has_wrong_len = len(self) != len(__o)
-        self_keys = set(self.mapper_by_name.keys())
-        other_keys = set(__o.mapper_by_name.keys())
-        has_wrong_keys = self_keys != other_keys
+    @cached_property
+    def signature(self) -> frozenset[tuple[str, str]]:
+        """Signature of the set, to compare sets without walking their variables.
 
-        if has_wrong_len or has_wrong_keys:
-            return False
+        The signature is computed once and reset when variables are added \
+        or removed. Its hash is cached, which makes unequal sets fast to compare.
 
-        repr_eq = [repr(self[key]) == repr(__o[key]) for key in self.mapper_by_name]
-        return np.all(repr_eq)
+        Returns
+        -------
+        frozenset[tuple[str, str]]
+            Names and representations of all variables.
+        """
+        return frozenset((var.name, repr(var)) for var in self._elements)
 
     def get(self, var_name: str) -> FromFileVariables:
         """Return the variable which name corresponds to var_name.
@@ -218,6 +240,21 @@ class VariableSet:
         self._instantiate_from_elements(elements)
         return var_to_suppress
 
+    def remove_many(self, var_names: list[str]) -> None:
+        """Remove all the variables with the given names at once.
+
+        Parameters
+        ----------
+        var_names : list[str]
+            Names of the variables to remove from the ensemble.
+        """
+        for var_name in var_names:
+            # Raise an error for invalid names
+            self.get(var_name)
+        to_remove = set(var_names)
+        elements = [e for e in self._elements if e.name not in to_remove]
+        self._instantiate_from_elements(elements)
+
     def has_name(self, var_name: str) -> bool:
         """Check if a variable name is the nam eof one of the variables.
 
@@ -514,6 +551,39 @@ class BaseRequiredVarsSet(VariableSet):
         KeyError
             If the variable is mandatory.
         """
+        self._check_removable(var_name)
+        return super().pop(var_name)
+
+    def remove_many(self, var_names: list[str]) -> None:
+        """Remove all the variables with the given names at once.
+
+        Parameters
+        ----------
+        var_names : list[str]
+            Names of the variables to remove from the ensemble.
+
+        Raises
+        ------
+        IncorrectVariableNameError
+            If one of the variables is mandatory.
+        """
+        for var_name in var_names:
+            self._check_removable(var_name)
+        super().remove_many(var_names)
+
+    def _check_removable(self, var_name: str) -> None:
+        """Check that a variable is not mandatory, and can therefore be removed.
+
+        Parameters
+        ----------
+        var_name : str
+            Name of the variable to remove from the ensemble.
+
+        Raises
+        ------
+        IncorrectVariableNameError
+            If the variable is mandatory.
+        """
         mandatory_variables_names = [
             self.expocode_var_name,
             self.provider_var_name,
@@ -532,7 +602,6 @@ class BaseRequiredVarsSet(VariableSet):
                 "it is a mandatory variable."
             )
             raise IncorrectVariableNameError(error_msg)
-        return super().pop(var_name)
 
     def _get_mandatory_variables_as_input_dict(self) -> dict[str, AllVariablesTypes]:
         """Return Mandatory variables as dict suitable for Set instanciation..
@@ -2,6 +2,7 @@
 
 from abc import ABC
 from collections.abc import Callable, Iterable
+from copy import copy
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import numpy as np
@@ -128,6 +129,23 @@ class BaseVar(ABC):
             return repr(self) == repr(__o)
         return False
 
+    def clone(self) -> "BaseVar":
+        """Copy the variable, only copying its mutable attributes.
+
+        Cheaper alternative to deepcopy, attributes which are lists, \
+        dictionnaries or sets are copied, the others are shared.
+
+        Returns
+        -------
+        BaseVar
+            Copy of the variable.
+        """
+        new_var = copy(self)
+        for name, value in self.__dict__.items():
+            if isinstance(value, list | dict | set):
+                setattr(new_var, name, copy(value))
+        return new_var
+
     @property
     def label(self) -> str:
         """Returns the label to use to find the variable data in a dataframe.
@@ -34,6 +34,7 @@ class TomlParser:
         "list": list,
         "tuple": tuple,
         "float": float,
+        "float32": "float32",
         "bool": bool,
         "datetime64[ns]": "datetime64[ns]",
     }
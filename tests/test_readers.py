@@ -0,0 +1,43 @@
+"""Tests for the files reading functions."""
+
+from pathlib import Path
+
+import pytest
+from bgc_data_processing.core.io.readers import read_files
+from bgc_data_processing.verbose import set_verbose_level
+
+_FILE_CONTENT = """\
+PROVIDER EXPOCODE YEAR MONTH DAY HOUR LONGITUDE LATITUDE DEPH TEMP
+[] [] [] [] [] [] [deg_E] [deg_N] [meter] [deg_C]
+ARGO 6900001 2010 4 26 0 1.0 63.0 -41.0 1.75
+ARGO 6900001 2010 4 27 6 3.9 65.8 -11.0 3.82
+GLODAP C1 2010 3 1 15 -0.3 58.8 -10.0 5.45
+GLODAP C2 2010 3 19 2 22.5 71.2 -20.0 8.36
+"""
+
+
+def test_read_files_groups_on_observed_values(tmp_path: Path) -> None:
+    """Grouping on read columns only creates groups for existing values."""
+    set_verbose_level(0)
+    filepath = tmp_path / "data.txt"
+    filepath.write_text(_FILE_CONTENT)
+    storer = read_files(filepath)
+    assert storer.providers == ["ARGO", "GLODAP"]
+    group = storer.data.groupby(["PROVIDER", "EXPOCODE"], dropna=False)
+    assert group.ngroups == 3
+    assert group.size().tolist() == [2, 1, 1]
+
+
+@pytest.mark.parametrize(("month", "day"), [(13, 1), (2, 31)])
+def test_read_files_raises_on_invalid_dates(
+    tmp_path: Path,
+    month: int,
+    day: int,
+) -> None:
+    """Dates which do not exist are not rolled over to the next month."""
+    set_verbose_level(0)
+    filepath = tmp_path / "data.txt"
+    content = _FILE_CONTENT.replace("2010 4 26", f"2010 {month} {day}")
+    filepath.write_text(content)
+    with pytest.raises(ValueError, match="out of range|unconverted"):
+        read_files(filepath)
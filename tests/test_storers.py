@@ -0,0 +1,98 @@
+"""Tests for the data storing objects."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from bgc_data_processing.core.storers import Storer
+from bgc_data_processing.core.variables.sets import StoringVariablesSet
+from bgc_data_processing.core.variables.vars import TemplateVar
+
+
+@pytest.fixture()
+def variables() -> StoringVariablesSet:
+    """Create storing variables with all mandatory variables."""
+    return StoringVariablesSet(
+        provider=TemplateVar("PROVIDER", "[]", str).not_in_file(),
+        expocode=TemplateVar("EXPOCODE", "[]", str).not_in_file(),
+        date=TemplateVar("DATE", "[]", "datetime64[ns]").not_in_file(),
+        year=TemplateVar("YEAR", "[]", int).not_in_file(),
+        month=TemplateVar("MONTH", "[]", int).not_in_file(),
+        day=TemplateVar("DAY", "[]", int).not_in_file(),
+        hour=TemplateVar("HOUR", "[]", int).not_in_file(),
+        latitude=TemplateVar("LATITUDE", "[deg_N]", float).not_in_file(),
+        longitude=TemplateVar("LONGITUDE", "[deg_E]", float).not_in_file(),
+        depth=TemplateVar("DEPH", "[m]", float).not_in_file(),
+        temperature=TemplateVar("TEMP", "[deg_C]", float).not_in_file(),
+    )
+
+
+def _make_data(providers: list, temperatures: list[float]) -> pd.DataFrame:
+    """Create data with all rows at the same place and time."""
+    n_rows = len(providers)
+    return pd.DataFrame(
+        {
+            "PROVIDER": providers,
+            "EXPOCODE": ["CRUISE"] * n_rows,
+            "DATE": pd.to_datetime(["2010-01-01"] * n_rows),
+            "YEAR": [2010] * n_rows,
+            "MONTH": [1] * n_rows,
+            "DAY": [1] * n_rows,
+            "HOUR": [0] * n_rows,
+            "LATITUDE": [70.0] * n_rows,
+            "LONGITUDE": [10.0] * n_rows,
+            "DEPH": [-5.0] * n_rows,
+            "TEMP": temperatures,
+        },
+    )
+
+
+def test_remove_duplicates_with_missing_provider(
+    variables: StoringVariablesSet,
+) -> None:
+    """Duplicates with a missing provider are sorted after the named providers."""
+    data = _make_data(["B", np.nan, "A"], [2.0, 3.0, 1.0])
+    storer = Storer(
+        data=data,
+        category="in_situ",
+        providers=["A", "B"],
+        variables=variables,
+    )
+    storer.remove_duplicates(priority_list=None)
+    assert storer.data["PROVIDER"].tolist() == ["A"]
+    assert storer.data["TEMP"].tolist() == [1.0]
+
+
+def test_remove_duplicates_keeps_named_over_missing_provider(
+    variables: StoringVariablesSet,
+) -> None:
+    """A named provider is kept over a missing one."""
+    data = _make_data([np.nan, "B"], [3.0, 2.0])
+    storer = Storer(
+        data=data,
+        category="in_situ",
+        providers=["B"],
+        variables=variables,
+    )
+    storer.remove_duplicates(priority_list=None)
+    assert storer.data["PROVIDER"].tolist() == ["B"]
+
+
+def test_storer_and_slice_have_no_instance_dict(
+    variables: StoringVariablesSet,
+) -> None:
+    """Storers and their slices only store their slotted attributes."""
+    storer = Storer(
+        data=_make_data(["A", "B"], [1.0, 2.0]),
+        category="in_situ",
+        providers=["A", "B"],
+        variables=variables,
+    )
+    data_slice = storer.slice_on_dates(
+        {
+            "start_date": pd.Timestamp("2010-01-01"),
+            "end_date": pd.Timestamp("2010-01-02"),
+        },
+    )
+    assert not hasattr(storer, "__dict__")
+    assert not hasattr(data_slice, "__dict__")
+    assert data_slice.data["TEMP"].tolist() == [1.0, 2.0]